@@ -1,10 +1,21 @@
 # mypy: disable - error - code = "no-untyped-def,misc"
 import pathlib
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Response
 from fastapi.staticfiles import StaticFiles
 
+from agent.utils.runtime import close_http_session
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the shared HTTP session used by research tools on shutdown."""
+    yield
+    await close_http_session()
+
+
 # Define the FastAPI app
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 def create_frontend_router(build_dir="../frontend/dist"):
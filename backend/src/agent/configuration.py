@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from typing import Any, Optional
 
@@ -64,6 +65,26 @@ class Configuration(BaseModel):
         default=5,
         metadata={"description": "Maximum tool calls per research session."},
     )
+    max_concurrent_tool_calls: int = Field(
+        default=8,
+        metadata={"description": "Maximum tool calls a researcher runs concurrently in one turn."},
+    )
+    researcher_batch_size: int = Field(
+        default=5,
+        metadata={"description": "Maximum researcher subgraphs run concurrently in one batch."},
+    )
+    max_llm_concurrency: int = Field(
+        default=8,
+        metadata={"description": "Maximum LLM requests in flight across all runs in the process. Fixed by the first request, so set it through MAX_LLM_CONCURRENCY rather than per run."},
+    )
+    enable_research_compression: bool = Field(
+        default=False,
+        metadata={"description": "Compress researcher findings with the LLM instead of returning a direct summary of the raw notes."},
+    )
+    compression_timeout: float = Field(
+        default=120.0,
+        metadata={"description": "Timeout in seconds for each LLM research compression attempt."},
+    )
     
     # MCP and Tool Configuration
     mcp_prompt: Optional[str] = Field(
@@ -92,7 +113,23 @@ class Configuration(BaseModel):
             field_name: os.environ.get(field_name.upper(), configurable.get(field_name))
             for field_name in field_names
         }
-        return cls(**{k: v for k, v in values.items() if v is not None})
+        resolved = tuple((k, v) for k, v in values.items() if v is not None)
+        try:
+            return _configuration_from_values(cls, resolved)
+        except TypeError:
+            # Unhashable override values cannot be memoized
+            return cls(**dict(resolved))
 
     class Config:
-        arbitrary_types_allowed = True
\ No newline at end of file
+        arbitrary_types_allowed = True
+        frozen = True
+
+
+@lru_cache(maxsize=64)
+def _configuration_from_values(cls, resolved: tuple) -> Configuration:
+    """Build a Configuration once per distinct set of resolved values.
+    
+    Every graph node parses its config on entry, and within a run the values
+    are the same each time, so the validated (frozen) instance is shared.
+    """
+    return cls(**dict(resolved))
\ No newline at end of file
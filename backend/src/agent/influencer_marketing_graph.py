@@ -6,7 +6,11 @@ It orchestrates the 7-phase campaign workflow using LangGraph subgraphs.
 """
 
 import os
+import time
+import hashlib
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Dict, Literal
 from agent.schemas.campaigns import CampaignBasicInfo, CalarifyCampaignInfoWithHuman
 from devtools import pprint
@@ -20,7 +24,8 @@ from langchain.chat_models import init_chat_model
 # Import state management
 from agent.state.states import AgentInputState, AgentState, CampaignState
 from agent.configuration import Configuration
-from agent.prompts.instructions import campaign_info_extraction_instructions, clarify_campaign_info_with_human_instructions, caliry_questions_template
+from agent.prompts.instructions import render_campaign_info_extraction, render_clarify_campaign_info, render_clarify_questions
+from agent.utils.runtime import structured_output_kwargs
 
 # Import utilities
 from agent.utils import setup_campaign_logging, log_phase_transition
@@ -30,9 +35,17 @@ load_dotenv()
 
 # Initialize configurable model
 def create_model(model_name: str, max_tokens: int = 4000, temperature: float = 0.0):
-    """Create a model instance with proper provider detection."""
-    api_key = get_api_key_for_model(model_name)
+    """Create a model instance with proper provider detection.
     
+    Instances are cached per settings and API key so nodes share one client and
+    its connections. The key is read on every call, so a rotated key gets a new client.
+    """
+    return _create_model(model_name, max_tokens, temperature, get_api_key_for_model(model_name))
+
+
+@lru_cache(maxsize=8)
+def _create_model(model_name: str, max_tokens: int, temperature: float, api_key: str):
+    """Build the model client for create_model, once per settings and API key."""
     if "gpt" in model_name.lower():
         return init_chat_model(
             model=model_name,
@@ -64,6 +77,17 @@ def create_model(model_name: str, max_tokens: int = 4000, temperature: float = 0
             disable_streaming=True,  # Use LangChain's proper parameter to disable streaming
         )
 
+def get_campaign_structured_model(model_name: str, schema: type, temperature: float):
+    """Get a cached model bound to a structured output schema; Gemini uses native JSON mode."""
+    return _get_campaign_structured_model(model_name, schema, temperature, get_api_key_for_model(model_name))
+
+
+@lru_cache(maxsize=8)
+def _get_campaign_structured_model(model_name: str, schema: type, temperature: float, api_key: str):
+    """Bind the structured output schema once per settings and API key."""
+    llm = _create_model(model_name, 4000, temperature, api_key)
+    return llm.with_structured_output(schema, **structured_output_kwargs(model_name))
+
 def get_api_key_for_model(model_name: str) -> str:
     """Get appropriate API key for the specified model."""
     # For GPT models (including GPT-5), use the OPENAI_API_KEY
@@ -80,7 +104,44 @@ def get_api_key_for_model(model_name: str) -> str:
 # Setup logging
 logger = logging.getLogger(__name__)
 
-def initialize_campaign_info(state: AgentState, config: RunnableConfig) -> AgentState:
+# Exact-match cache of extracted campaign info, keyed on model and user messages
+_CAMPAIGN_INFO_CACHE: "OrderedDict[tuple[str, bytes], tuple[float, CampaignBasicInfo]]" = OrderedDict()
+_CAMPAIGN_INFO_CACHE_MAX_SIZE = 1024
+_CAMPAIGN_INFO_CACHE_TTL = 3600.0
+
+
+def _campaign_info_cache_key(model_name: str, user_messages: str) -> tuple[str, bytes]:
+    """Build a compact cache key for the given model and conversation."""
+    digest = hashlib.blake2b(user_messages.strip().encode(), digest_size=16).digest()
+    return model_name, digest
+
+
+def _get_cached_campaign_info(key: tuple[str, bytes]):
+    """Return a copy of the cached campaign info for the key, or None when missing or expired.
+    
+    Copies keep later edits to one run's state from leaking into the cache.
+    """
+    entry = _CAMPAIGN_INFO_CACHE.get(key)
+    if entry is None:
+        return None
+    
+    cached_at, campaign_basic_info = entry
+    if time.monotonic() - cached_at > _CAMPAIGN_INFO_CACHE_TTL:
+        del _CAMPAIGN_INFO_CACHE[key]
+        return None
+    
+    _CAMPAIGN_INFO_CACHE.move_to_end(key)
+    return campaign_basic_info.model_copy(deep=True)
+
+
+def _cache_campaign_info(key: tuple[str, bytes], campaign_basic_info: CampaignBasicInfo) -> None:
+    """Store extracted campaign info, evicting the least recently used entry when full."""
+    _CAMPAIGN_INFO_CACHE[key] = (time.monotonic(), campaign_basic_info.model_copy(deep=True))
+    _CAMPAIGN_INFO_CACHE.move_to_end(key)
+    if len(_CAMPAIGN_INFO_CACHE) > _CAMPAIGN_INFO_CACHE_MAX_SIZE:
+        _CAMPAIGN_INFO_CACHE.popitem(last=False)
+
+async def initialize_campaign_info(state: AgentState, config: RunnableConfig) -> AgentState:
     """
     Node 1: Extract structured campaign information from user messages.
     
@@ -88,27 +149,29 @@ def initialize_campaign_info(state: AgentState, config: RunnableConfig) -> Agent
     Schema: Uses CampaignBasicInfo for structured data extraction
     """
     logger.info("🔍 Initializing campaign info")
-    logger.info(f"config: {config}")
+    logger.debug("config: %s", config)
     configurable = Configuration.from_runnable_config(config)
     
     # Get user messages for extraction
     user_messages = get_buffer_string(state["messages"])
     
-    # Initialize LLM with structured output for information extraction
-    llm = create_model(configurable.query_generator_model, max_tokens=4000, temperature=0.1)
+    # Identical conversations extract identical campaign info, so skip the LLM on repeats
+    cache_key = _campaign_info_cache_key(configurable.default_model, user_messages)
+    campaign_basic_info = _get_cached_campaign_info(cache_key)
+    if campaign_basic_info is None:
+        # Use CampaignBasicInfo for information extraction
+        structured_llm = get_campaign_structured_model(configurable.default_model, CampaignBasicInfo, 0.1)
+        formatted_prompt = render_campaign_info_extraction(messages=user_messages)
+        campaign_basic_info = await structured_llm.ainvoke(formatted_prompt)
+        _cache_campaign_info(cache_key, campaign_basic_info)
     
-    # Use CampaignBasicInfo for information extraction
-    structured_llm = llm.with_structured_output(CampaignBasicInfo)
-    formatted_prompt = campaign_info_extraction_instructions.format(messages=user_messages)
-    campaign_basic_info = structured_llm.invoke(formatted_prompt)
-    
-    logger.info(f"🔍 Campaign Basic Info Extracted: {campaign_basic_info}")
+    logger.info("🔍 Campaign Basic Info Extracted: %s", campaign_basic_info)
     
     return {
         "campaign_basic_info": campaign_basic_info
     }
 
-def auto_clarify_campaign_info(state: AgentState, config: RunnableConfig) -> Command[Literal["request_human_review", "__end__"]]:
+async def auto_clarify_campaign_info(state: AgentState, config: RunnableConfig) -> Command[Literal["request_human_review", "__end__"]]:
     """
     Node 2: AI determines if extracted info needs clarification from user.
     
@@ -124,25 +187,22 @@ def auto_clarify_campaign_info(state: AgentState, config: RunnableConfig) -> Com
     # if state.get("need_clarification") is not None:
     #     return Command(goto="request_human_review")
     
-    # Initialize LLM for clarification assessment
-    llm = create_model(configurable.query_generator_model, max_tokens=4000, temperature=0.0)
-    
     # Use CalarifyCampaignInfoWithHuman for clarification judgment
-    structured_llm = llm.with_structured_output(CalarifyCampaignInfoWithHuman)
-    formatted_prompt = clarify_campaign_info_with_human_instructions.format(
+    structured_llm = get_campaign_structured_model(configurable.default_model, CalarifyCampaignInfoWithHuman, 0.0)
+    formatted_prompt = render_clarify_campaign_info(
         messages=get_buffer_string(state["messages"]),
         campaign_basic_info=state["campaign_basic_info"],
     )
-    clarify_campaign_info_with_human = structured_llm.invoke(formatted_prompt)
-    logger.info(f"🔍 auto_clarify_campaign_info - clarify_campaign_info_with_human response: {clarify_campaign_info_with_human}")
+    clarify_campaign_info_with_human = await structured_llm.ainvoke(formatted_prompt)
+    logger.info("🔍 auto_clarify_campaign_info - clarify_campaign_info_with_human response: %s", clarify_campaign_info_with_human)
     # Critical Decision: Does AI think clarification is needed?
     if clarify_campaign_info_with_human.need_clarification:
         # End flow with clarification questions for user
-        logger.info(f"🔍 auto_clarify_campaign_info - Need clarification: {clarify_campaign_info_with_human.questions}")
+        logger.info("🔍 auto_clarify_campaign_info - Need clarification: %s", clarify_campaign_info_with_human.questions)
         return Command(
             goto="__end__",
             update={
-                "messages": [AIMessage(content=caliry_questions_template.format(
+                "messages": [AIMessage(content=render_clarify_questions(
                     questions=clarify_campaign_info_with_human.questions,
                     campaign_basic_info=state["campaign_basic_info"])),
                 ],
@@ -150,7 +210,7 @@ def auto_clarify_campaign_info(state: AgentState, config: RunnableConfig) -> Com
             }
         )
     else:
-        logger.info(f"🔍 auto_clarify_campaign_info - No clarification needed")
+        logger.info("🔍 auto_clarify_campaign_info - No clarification needed")
         return Command(
             goto="request_human_review",
             update={"need_clarification": False}
@@ -170,20 +230,20 @@ def request_human_review(state: AgentState, config: RunnableConfig) -> Command[L
     
     # Idempotency check: Skip interrupt if already have human result
     if state.get("human_review_compagin_info_result") is not None:
-        logger.info(f"🔍 request_human_review - Already reviewed, human_review_compagin_info_result is not None")
+        logger.info("🔍 request_human_review - Already reviewed, human_review_compagin_info_result is not None")
         # Already reviewed, route based on previous result
         return Command(goto="generate_campaign_plan" if state["human_review_compagin_info_result"] else "__end__")
     
     # Configuration bypass: Auto-approve if skip is enabled
     if configurable.allow_skip_human_review_campaign_info:
-        logger.info(f"🔍 request_human_review - Skip review, allow_skip_human_review_campaign_info is True")
+        logger.info("🔍 request_human_review - Skip review, allow_skip_human_review_campaign_info is True")
         return Command(
             goto="generate_campaign_plan",
             update={"human_review_compagin_info_result": True}
         )
     
     # CRITICAL: interrupt() pauses execution and returns resume value
-    logger.info(f"🔍 request_human_review - Calling interrupt, waiting for human input...")
+    logger.info("🔍 request_human_review - Calling interrupt, waiting for human input...")
     human_decision = interrupt({
         "type": "human_review_request",
         "title": "请审核营销活动基本信息",
@@ -191,19 +251,19 @@ def request_human_review(state: AgentState, config: RunnableConfig) -> Command[L
         "campaign_info": state["campaign_basic_info"]  # 提供结构化数据给前端
     })
     
-    logger.info(f"🔍 request_human_review - Human decision received: {human_decision}")
+    logger.info("🔍 request_human_review - Human decision received: %s", human_decision)
     
     # Process the human decision directly from interrupt() return value
     if human_decision:
         # Approved: Continue to campaign plan generation
-        logger.info(f"🔍 request_human_review - Human approved, continuing to generate campaign plan")
+        logger.info("🔍 request_human_review - Human approved, continuing to generate campaign plan")
         return Command(
             goto="generate_campaign_plan",
             update={"human_review_compagin_info_result": True}
         )
     else:
         # Rejected: End flow with feedback message
-        logger.info(f"🔍 request_human_review - Human rejected, ending flow")
+        logger.info("🔍 request_human_review - Human rejected, ending flow")
         return Command(
             goto="__end__",
             update={
@@ -6,26 +6,33 @@ for the influencer search agent. Each node has a single responsibility
 following LangGraph best practices.
 """
 
+import asyncio
 import logging
+import random
+from functools import lru_cache
 from typing import Dict, Any, Literal
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, get_buffer_string
 from langchain_core.runnables import RunnableConfig
 from langgraph.types import Command
 from langgraph.graph import END
 
 # Import local modules
-from agent.influencer_search.state import InfluencerSearchState
+from agent.influencer_search.state import InfluencerSearchState, ResearchMetadata
 from agent.influencer_search.schemas import ClarifyWithUser, InfluencerResearchBrief
 from agent.influencer_search.prompts import (
     CLARIFY_WITH_USER_INSTRUCTIONS,
+    render_clarify_prompt,
     TRANSFORM_MESSAGES_INTO_INFLUENCER_RESEARCH_BRIEF_PROMPT,
-    INFLUENCER_RESEARCH_SUPERVISOR_PROMPT,
-    FINAL_REPORT_GENERATION_PROMPT,
+    render_research_brief_prompt,
+    render_final_report_prompt_prefix,
+    FINAL_REPORT_PROMPT_SUFFIX,
+    cacheable_system_message,
+    get_supervisor_system_prompt,
     get_today_str,
     is_token_limit_exceeded,
     get_model_token_limit
 )
+from agent.utils.runtime import get_or_create_model, get_llm_semaphore, structured_output_kwargs
 from agent.configuration import Configuration
 
 # Setup logging
@@ -34,6 +41,72 @@ logger = logging.getLogger(__name__)
 # Simplified model initialization using init_chat_model best practices
 
 
+@lru_cache(maxsize=8)
+def get_retrying_structured_model(model_name: str, schema: type, max_retries: int):
+    """Get a pooled model bound to a structured output schema, built once per settings.
+    
+    with_structured_output converts the pydantic schema on every call, so the
+    bound runnable is cached per model, schema and retries. Gemini models use
+    native JSON mode; other providers keep their default structured output method.
+    
+    Args:
+        model_name: Model identifier in provider:model format
+        schema: Pydantic model describing the structured output
+        max_retries: Maximum attempts for the model call
+        
+    Returns:
+        Runnable returning instances of the schema
+    """
+    return (
+        get_or_create_model(model_name, 0.0)
+        .with_structured_output(schema, **structured_output_kwargs(model_name))
+        .with_retry(stop_after_attempt=max_retries)
+    )
+
+
+@lru_cache(maxsize=8)
+def get_clarify_system_message(model_name: str) -> SystemMessage:
+    """Get the static clarification instructions as a cacheable system message."""
+    return cacheable_system_message(CLARIFY_WITH_USER_INSTRUCTIONS, model_name)
+
+
+@lru_cache(maxsize=8)
+def get_research_brief_system_message(model_name: str) -> SystemMessage:
+    """Get the static research brief instructions as a cacheable system message."""
+    return cacheable_system_message(TRANSFORM_MESSAGES_INTO_INFLUENCER_RESEARCH_BRIEF_PROMPT, model_name)
+
+
+def _extend_messages_buffer(messages_buffer: str, message) -> str:
+    """Append one message to a get_buffer_string() rendering without re-rendering the history."""
+    message_buffer = get_buffer_string([message])
+    return f"{messages_buffer}\n{message_buffer}" if messages_buffer else message_buffer
+
+
+async def _generate_research_brief(messages_buffer: str, configurable: Configuration) -> InfluencerResearchBrief:
+    """Generate the structured research brief for the given conversation.
+    
+    Args:
+        messages_buffer: Conversation rendered with get_buffer_string()
+        configurable: Parsed runtime configuration
+        
+    Returns:
+        Structured InfluencerResearchBrief from the research model
+    """
+    research_model = get_retrying_structured_model(
+        configurable.default_model,
+        InfluencerResearchBrief,
+        configurable.max_structured_output_retries,
+    )
+    
+    prompt_content = render_research_brief_prompt(messages=messages_buffer)
+    
+    # Let structured output fail naturally if parsing fails
+    async with get_llm_semaphore(configurable.max_llm_concurrency):
+        return await research_model.ainvoke([
+            get_research_brief_system_message(configurable.default_model),
+            HumanMessage(content=prompt_content)
+        ])
+
 
 async def clarify_with_user(state: InfluencerSearchState, config: RunnableConfig) -> Command[Literal["write_research_brief", "__end__"]]:
     """Analyze user messages and ask clarifying questions if the search scope is unclear.
@@ -52,69 +125,74 @@ async def clarify_with_user(state: InfluencerSearchState, config: RunnableConfig
     
     # Step 1: Check if clarification is enabled in configuration
     configurable = Configuration.from_runnable_config(config)
-    logger.info(f"Configurable: {configurable}")
+    logger.debug("Configurable: %s", configurable)
     if not configurable.allow_clarification:
         # Skip clarification step and proceed directly to research brief generation
         logger.info("Clarification disabled, proceeding to research brief generation")
-        return Command(goto="write_research_brief")
+        # Drop any buffer left from a previous turn; write_research_brief renders a fresh one
+        return Command(goto="write_research_brief", update={"messages_buffer": None})
     
     # Step 2: Prepare the model for structured clarification analysis
     messages = state["messages"]
     
-    # Simple model initialization using init_chat_model best practices
-    # Pass API key explicitly for Google GenAI to avoid default credentials lookup
-    model_kwargs = {
-        "model": configurable.default_model,
-        "temperature": 0.0,
-    }
-    
-    # Add API key for Google GenAI models
-    if "google_genai" in configurable.default_model:
-        import os
-        api_key = os.getenv("GEMINI_API_KEY")
-        if api_key:
-            model_kwargs["api_key"] = api_key
-    
-    clarification_model = (
-        init_chat_model(**model_kwargs)
-        .with_structured_output(ClarifyWithUser)
-        .with_retry(stop_after_attempt=configurable.max_structured_output_retries)
+    # Reuse the pooled model client across requests
+    clarification_model = get_retrying_structured_model(
+        configurable.default_model,
+        ClarifyWithUser,
+        configurable.max_structured_output_retries,
     )
     
     # Step 3: Analyze whether clarification is needed
-    prompt_content = CLARIFY_WITH_USER_INSTRUCTIONS.format(
-        messages=get_buffer_string(messages), 
+    # The rendered history is passed on to write_research_brief
+    messages_buffer = get_buffer_string(messages)
+    prompt_content = render_clarify_prompt(
+        messages=messages_buffer, 
         date=get_today_str()
     )
     
+    # The research brief is generated only once clarification finds nothing to ask,
+    # so turns that end with a question never pay for it
     try:
-        response = await clarification_model.ainvoke([HumanMessage(content=prompt_content)])
-        logger.info(f"Clarification analysis result: need_clarification={response.need_clarification}")
+        async with get_llm_semaphore(configurable.max_llm_concurrency):
+            response = await clarification_model.ainvoke([
+                get_clarify_system_message(configurable.default_model),
+                HumanMessage(content=prompt_content)
+            ])
+        logger.info("Clarification analysis result: need_clarification=%s", response.need_clarification)
         
         # Step 4: Route based on clarification analysis
         if response.need_clarification:
             # End with clarifying question for user
-            logger.info(f"Asking clarification question: {response.question}")
+            logger.info("Asking clarification question: %s", response.question)
             return Command(
                 goto=END, 
-                update={"messages": [AIMessage(content=response.question)]}
+                update={
+                    "messages": [AIMessage(content=response.question)],
+                    "messages_buffer": None
+                }
             )
         else:
             # Proceed to research brief generation with verification message
-            logger.info(f"No clarification needed, proceeding with verification: {response.verification}")
+            logger.info("No clarification needed, proceeding with verification: %s", response.verification)
+            verification_message = AIMessage(content=response.verification)
             return Command(
                 goto="write_research_brief", 
-                update={"messages": [AIMessage(content=response.verification)]}
+                update={
+                    "messages": [verification_message],
+                    "messages_buffer": _extend_messages_buffer(messages_buffer, verification_message)
+                }
             )
             
     except Exception as e:
-        logger.error(f"Error in clarification analysis: {e}")
+        logger.error("Error in clarification analysis: %s", e)
         # On error, proceed to research brief generation to avoid blocking
+        continue_message = AIMessage(content="继续进行影响者研究分析...")
         return Command(
             goto="write_research_brief",
             update={
                 "last_error": f"Clarification analysis failed: {str(e)}",
-                "messages": [AIMessage(content="继续进行影响者研究分析...")]
+                "messages": [continue_message],
+                "messages_buffer": _extend_messages_buffer(messages_buffer, continue_message)
             }
         )
 
@@ -140,68 +218,42 @@ async def write_research_brief(state: InfluencerSearchState, config: RunnableCon
         configurable = Configuration.from_runnable_config(config)
         
         # DEBUG: Print configuration details
-        logger.info(f"🔍 DEBUG - Model: {configurable.default_model}")
-        
-        # Simple model initialization for structured research brief generation
-        # Pass API key explicitly for Google GenAI to avoid default credentials lookup
-        model_kwargs = {
-            "model": configurable.default_model,
-            "temperature": 0.0,
-        }
-        
-        # Add API key for Google GenAI models
-        if "google_genai" in configurable.default_model:
-            import os
-            api_key = os.getenv("GEMINI_API_KEY")
-            if api_key:
-                model_kwargs["api_key"] = api_key
-        
-        base_model = init_chat_model(**model_kwargs)
-        
-        
-        research_model = (
-            base_model
-            .with_structured_output(InfluencerResearchBrief)
-            .with_retry(stop_after_attempt=configurable.max_structured_output_retries)
-        )
-        
-        # Step 2: Generate structured research brief from user messages
-        prompt_content = TRANSFORM_MESSAGES_INTO_INFLUENCER_RESEARCH_BRIEF_PROMPT.format(
-            messages=get_buffer_string(state.get("messages", []))
-        )
+        logger.debug("🔍 Model: %s", configurable.default_model)
         
+        # Step 2: Generate the research brief from the conversation, including clarify's verification
+        # Messages do not change again before the final report, so the buffer is kept for it
+        messages_buffer = state.get("messages_buffer") or get_buffer_string(state.get("messages", []))
         logger.info("🤖 Generating influencer structured research brief...")
-        
-        # Now try structured output - let it fail naturally if parsing fails
-        response = await research_model.ainvoke([HumanMessage(content=prompt_content)])
+        response = await _generate_research_brief(messages_buffer, configurable)
         
         logger.info("✅ Influencer research brief generated successfully")
-        logger.info(f"🔍 DEBUG - Structured response: {response}")
+        logger.debug("🔍 Structured response: %s", response)
         
         # Step 3: Initialize supervisor with research brief and instructions
-        supervisor_system_prompt = INFLUENCER_RESEARCH_SUPERVISOR_PROMPT.format(
-            max_concurrent_research_units=configurable.max_concurrent_research_units,
-            max_researcher_iterations=configurable.max_researcher_iterations
+        supervisor_system_prompt = get_supervisor_system_prompt(
+            configurable.max_concurrent_research_units,
+            configurable.max_researcher_iterations
         )
         
         return Command(
             goto="research_supervisor", 
             update={
+                "messages_buffer": messages_buffer,
                 "research_brief": response.research_brief,
-                "research_metadata": {
-                    "target_platforms": response.target_platforms,
-                    "niche_focus": response.niche_focus,
-                    "geographic_focus": response.geographic_focus,
-                    "follower_range": response.follower_range,
-                    "campaign_objectives": response.campaign_objectives,
-                    "budget": response.budget,
-                    "content_requirements": response.content_requirements,
+                "research_metadata": ResearchMetadata(
+                    target_platforms=response.target_platforms,
+                    niche_focus=response.niche_focus,
+                    geographic_focus=response.geographic_focus,
+                    follower_range=response.follower_range,
+                    campaign_objectives=response.campaign_objectives,
+                    budget=response.budget,
+                    content_requirements=response.content_requirements,
                     # timeline removed from schema; no longer included
-                },
+                ),
                 "supervisor_messages": {
                     "type": "override",
                     "value": [
-                        SystemMessage(content=supervisor_system_prompt),
+                        cacheable_system_message(supervisor_system_prompt, configurable.default_model),
                         HumanMessage(content=response.research_brief)
                     ]
                 }
@@ -209,13 +261,14 @@ async def write_research_brief(state: InfluencerSearchState, config: RunnableCon
         )
         
     except Exception as e:
-        logger.error(f"Error in research brief generation: {e}")
+        logger.error("Error in research brief generation: %s", e)
         # On error, end workflow with error message
         error_message = f"Research brief generation failed: {str(e)}"
         return Command(
             goto=END,
             update={
                 "last_error": error_message,
+                "messages_buffer": None,
                 "messages": [AIMessage(content="⚠️ 研究摘要生成遇到问题，无法继续处理请求。请重新描述您的需求。")]
             }
         )
@@ -232,8 +285,6 @@ async def final_report_generation(state: InfluencerSearchState, config: Runnable
     Returns:
         Dictionary containing the final report and updated state
     """
-    import asyncio
-    
     logger.info("📝 Starting final report generation")
     
     # Extract research findings
@@ -251,40 +302,32 @@ async def final_report_generation(state: InfluencerSearchState, config: Runnable
     
     # Configure model
     configurable = Configuration.from_runnable_config(config)
-    logger.info(f"🤖 Using model {configurable.final_report_model} for report generation")
+    logger.info("🤖 Using model %s for report generation", configurable.final_report_model)
     
-    # Prepare comprehensive prompt
-    final_report_prompt = FINAL_REPORT_GENERATION_PROMPT.format(
+    # Prepare comprehensive prompt; only the findings vary between attempts
+    report_prompt_prefix = render_final_report_prompt_prefix(
         research_brief=state.get("research_brief", ""),
-        messages=get_buffer_string(state.get("messages", [])),
-        findings=findings,
+        messages=state.get("messages_buffer") or get_buffer_string(state.get("messages", [])),
         date=get_today_str()
     )
     
-    # Initialize model with API key
-    model_kwargs = {
-        "model": configurable.final_report_model,
-        "temperature": 0.0,
-    }
-    
-    if "google_genai" in configurable.final_report_model:
-        import os
-        api_key = os.getenv("GEMINI_API_KEY")
-        if api_key:
-            model_kwargs["api_key"] = api_key
-    
-    writer_model = init_chat_model(**model_kwargs)
+    # Reuse the pooled model client across reports
+    writer_model = get_or_create_model(configurable.final_report_model, 0.0)
     
     # Retry logic with detailed error logging
     max_retries = 3
+    findings_char_limit = None
+    last_exception = None
     
     for attempt in range(max_retries + 1):
         try:
-            logger.info(f"🚀 Generating final report (attempt {attempt + 1}/{max_retries + 1})")
+            logger.info("🚀 Generating final report (attempt %d/%d)", attempt + 1, max_retries + 1)
             
-            final_report = await writer_model.ainvoke([
-                HumanMessage(content=final_report_prompt)
-            ])
+            final_report_prompt = report_prompt_prefix + findings + FINAL_REPORT_PROMPT_SUFFIX
+            async with get_llm_semaphore(configurable.max_llm_concurrency):
+                final_report = await writer_model.ainvoke([
+                    HumanMessage(content=final_report_prompt)
+                ])
             
             logger.info("✅ Final report generated successfully")
             
@@ -292,28 +335,48 @@ async def final_report_generation(state: InfluencerSearchState, config: Runnable
                 "final_report": final_report.content, 
                 "messages": [final_report],
                 "report_completed": True,
+                "messages_buffer": None,  # The report message makes the buffer stale
                 "notes": {"type": "override", "value": []}  # Clear notes after successful generation
             }
             
         except Exception as e:
+            last_exception = e
             # Detailed error logging
-            logger.error(f"报告生成失败 - 尝试次数: {attempt + 1}/{max_retries + 1}")
-            logger.error(f"错误类型: {type(e).__name__}")
-            logger.error(f"错误详情: {str(e)}")
-            logger.error(f"研究数据长度: {len(findings)} 字符")
-            logger.error(f"使用模型: {configurable.final_report_model}")
+            logger.error("报告生成失败 - 尝试次数: %d/%d", attempt + 1, max_retries + 1)
+            logger.error("错误类型: %s", type(e).__name__)
+            logger.error("错误详情: %s", e)
+            logger.error("研究数据长度: %d 字符", len(findings))
+            logger.error("使用模型: %s", configurable.final_report_model)
+            
+            if attempt >= max_retries:
+                break
             
-            if attempt < max_retries:
-                logger.warning(f"第{attempt + 1}次尝试失败，1秒后重试...")
-                await asyncio.sleep(1)  # 1秒延迟避免API限流
+            model_token_limit = get_model_token_limit(configurable.final_report_model)
+            if is_token_limit_exceeded(e, configurable.final_report_model) and model_token_limit:
+                if findings_char_limit is None:
+                    # ~4 characters per token: give the findings whatever the prompt template leaves
+                    findings_char_limit = model_token_limit * 4 - len(report_prompt_prefix) - len(FINAL_REPORT_PROMPT_SUFFIX)
+                else:
+                    findings_char_limit = int(findings_char_limit * 0.9)
+                
+                if findings_char_limit <= 0:
+                    # Prompt overhead alone overflows the context window; another request cannot succeed
+                    logger.error("报告提示词本身已超出模型上下文限制，停止重试")
+                    break
+                
+                findings = findings[:findings_char_limit]
+                logger.warning("第%d次尝试超出上下文限制，研究数据截断至%d字符后重试...", attempt + 1, len(findings))
                 continue
-            else:
-                logger.error(f"报告生成在{max_retries + 1}次尝试后最终失败")
-                return {
-                    "final_report": f"❌ 报告生成失败：{str(e)}",
-                    "messages": [AIMessage(content="⚠️ 报告生成在多次重试后失败，请检查配置和网络连接")],
-                    "report_completed": False,
-                    "notes": {"type": "override", "value": []}
-                }
-
-
+            
+            # 指数退避加随机抖动，避免并发请求在API限流后同时重试
+            backoff = 2 ** attempt + random.uniform(0, 1)
+            logger.warning("第%d次尝试失败，%.1f秒后重试...", attempt + 1, backoff)
+            await asyncio.sleep(backoff)
+    
+    logger.error("报告生成在%d次尝试后最终失败", attempt + 1)
+    return {
+        "final_report": f"❌ 报告生成失败：{str(last_exception)}",
+        "messages": [AIMessage(content="⚠️ 报告生成在多次重试后失败，请检查配置和网络连接")],
+        "report_completed": False,
+        "notes": {"type": "override", "value": []}
+    }
@@ -5,21 +5,22 @@ Contains all LLM prompt templates used throughout the influencer search
 process, organized by functionality and optimized for Gemini models.
 """
 
-from datetime import datetime
-from typing import Optional
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Any, Optional
+
+from langchain_core.messages import SystemMessage
+
+from agent.prompts.templating import compile_prompt_template
 
 # Legacy prompts removed - using research-oriented workflow only
 
 
 # Clarification Prompts
+# The instructions are static and sent as the system message so providers can cache them;
+# only the conversation and date vary per turn and follow in the human message
 CLARIFY_WITH_USER_INSTRUCTIONS = """
-These are the messages that have been exchanged so far from the user asking for influencer search:
-<Messages>
-{messages}
-</Messages>
-
-Today's date is {date}.
-
 Assess whether you need to ask a clarifying question, or if the user has already provided enough information for you to start the influencer search.
 IMPORTANT: If you can see in the messages history that you have already asked a clarifying question, you almost always do not need to ask another one. Only ask another question if ABSOLUTELY NECESSARY.
 
@@ -53,21 +54,34 @@ For the verification message when no clarification is needed:
 - Keep the message concise and professional
 """
 
+CLARIFY_WITH_USER_MESSAGES = """
+These are the messages that have been exchanged so far from the user asking for influencer search:
+<Messages>
+{messages}
+</Messages>
+
+Today's date is {date}.
+"""
+
+render_clarify_prompt = compile_prompt_template(CLARIFY_WITH_USER_MESSAGES)
+
+
+@lru_cache(maxsize=1)
+def _format_date(day: date) -> str:
+    """Format a date the way prompts present it, once per day."""
+    return day.strftime("%B %d, %Y")
+
 
 def get_today_str() -> str:
     """Get today's date as a formatted string"""
-    return datetime.now().strftime("%B %d, %Y")
+    return _format_date(date.today())
 
 
 # Influencer Marketing Research Prompts
+# As with clarification, the static instructions are the system message and the conversation follows
 TRANSFORM_MESSAGES_INTO_INFLUENCER_RESEARCH_BRIEF_PROMPT = """You will be given a set of messages that have been exchanged so far between yourself and the user. 
 Your job is to translate these messages into a more detailed and concrete influencer research task brief that will be used to guide the influencer research.
 
-The messages that have been exchanged so far between yourself and the user are:
-<Messages>
-{messages}
-</Messages>
-
 You will return a single influencer research task brief that will be used to guide the influencer research.
 
 Guidelines:
@@ -93,6 +107,12 @@ Guidelines:
 - If the query is in a specific language, prioritize sources published in that language.
 """
 
+RESEARCH_BRIEF_MESSAGES = """The messages that have been exchanged so far between yourself and the user are:
+<Messages>
+{messages}
+</Messages>
+"""
+
 INFLUENCER_RESEARCH_SUPERVISOR_PROMPT = """Influencer research is most important of all in influencer marketing. You are a influencer research supervisor. Your job is to conduct influencer research by calling the "ConductInfluencerResearch" tool.
 
 <Task>
@@ -117,15 +137,6 @@ Think like a influencer research manager with limited time and resources. Follow
 3. **After each call to ConductInfluencerResearch, pause and assess** - Do I have enough influencers to finish the influencer task? What's still missing?
 </Instructions>
 
-<Hard Limits>
-**Task Delegation Budgets** (Prevent excessive delegation):
-- **Bias towards single agent** - Use single agent for simplicity unless the user request has clear opportunity for parallelization
-- **Stop when you finish the task confidently** - Don't keep delegating influencer research for perfection
-- **Limit tool calls** - Always stop after {max_researcher_iterations} tool calls to ConductInfluencerResearch and think_tool if you cannot find the right influencers
-
-**Maximum {max_concurrent_research_units} parallel agents per iteration**
-</Hard Limits>
-
 <Show Your Thinking>
 Before you call ConductInfluencerResearch tool call, use think_tool to plan your approach:
 - Can the task be broken down into smaller sub-tasks?
@@ -150,136 +161,39 @@ After each ConductInfluencerResearch tool call, use think_tool to analyze the re
 - A separate agent will write the final report - you just need to gather information
 - When calling ConductInfluencerResearch, provide complete standalone instructions - sub-agents can't see other agents' work
 - Do NOT use acronyms or abbreviations in your research questions, be very clear and specific
-</Scaling Rules>"""
-
-
-# Research Tools and Utilities
-# ============================
-
-from langchain_core.tools import tool
+</Scaling Rules>
 
-@tool(description="Strategic reflection tool for influencer marketing research planning")
-def think_tool(reflection: str) -> str:
-    """Tool for strategic reflection on influencer marketing research progress and decision-making.
+<Hard Limits>
+**Task Delegation Budgets** (Prevent excessive delegation):
+- **Bias towards single agent** - Use single agent for simplicity unless the user request has clear opportunity for parallelization
+- **Stop when you finish the task confidently** - Don't keep delegating influencer research for perfection
+- **Limit tool calls** - Always stop after {max_researcher_iterations} tool calls to ConductInfluencerResearch and think_tool if you cannot find the right influencers
 
-    Use this tool during research supervision to analyze progress and plan next steps systematically.
-    This creates a deliberate pause in the research workflow for quality decision-making in influencer campaigns.
+**Maximum {max_concurrent_research_units} parallel agents per iteration**
+</Hard Limits>"""
 
-    When to use:
-    - After receiving research results: What key influencer insights did I discover?
-    - Before deciding next steps: Do I have enough data to make campaign recommendations?
-    - When assessing research gaps: What specific influencer marketing information am I still missing?
-    - Before concluding research: Can I provide actionable influencer recommendations now?
 
-    Reflection should address:
-    1. Analysis of current findings - What concrete influencer marketing insights have I gathered?
-    2. Gap assessment - What crucial campaign planning information is still missing?
-    3. Quality evaluation - Do I have sufficient influencer data/examples for strategic recommendations?
-    4. Strategic decision - Should I continue researching or provide campaign recommendations?
+render_research_brief_prompt = compile_prompt_template(RESEARCH_BRIEF_MESSAGES)
+# The configurable limits sit in the trailing <Hard Limits> section, so the instructions
+# before it form a prefix that provider prompt caches share across configurations
+_render_supervisor_prompt = compile_prompt_template(INFLUENCER_RESEARCH_SUPERVISOR_PROMPT)
 
-    Args:
-        reflection: Your detailed reflection on research progress, findings, gaps, and next steps
 
-    Returns:
-        Confirmation that reflection was recorded for decision-making
+@lru_cache(maxsize=16)
+def get_supervisor_system_prompt(max_concurrent_research_units: int, max_researcher_iterations: int) -> str:
+    """Render the supervisor system prompt for the given research limits.
+    
+    The prompt only depends on configuration values, so the rendered string is
+    memoized and shared across workflow runs with the same limits.
     """
-    return f"Strategic reflection recorded: {reflection}"
-
-@tool(description="Multi-platform influencer search engine supporting YouTube, Instagram, and TikTok.")
-async def influencer_search_tool(
-    keywords: list[str],
-    platform: str = "youtube",
-    min_followers: int = 50000,
-    max_followers: int = 1000000,
-    countries: str = "US,UK",
-    language: str = "en",
-    limit: int = 200
-) -> str:
-    """Search for influencers across social media platforms using keyword-based filtering.
+    return _render_supervisor_prompt(
+        max_concurrent_research_units=max_concurrent_research_units,
+        max_researcher_iterations=max_researcher_iterations
+    )
 
-    Args:
-        keywords: List of search keywords to find relevant influencers
-        platform: Target platform for search (youtube, instagram, or tiktok)
-        min_followers: Minimum follower count threshold for filtering results
-        max_followers: Maximum follower count threshold for filtering results
-        countries: Comma-separated country codes for geographic filtering (e.g., "US,UK,CA")
-        language: Language code for content language filtering (e.g., "en", "es")
-        limit: Maximum number of results to return (capped at 200 for API limits)
 
-    Returns:
-        Formatted string containing influencer profiles with metrics including name, 
-        follower count, location, engagement rate, average views, and Nox score.
-    """
-    import aiohttp
-    import os
-    
-    # Validate platform
-    if platform.lower() not in ['youtube', 'instagram', 'tiktok']:
-        return f"Unsupported platform: {platform}"
-    # API configuration
-    base_url = os.getenv('INFLUENCER_API_BASE_URL', 'http://10.101.150.253:10155')
-    uid = os.getenv('INFLUENCER_API_UID', '5773389b0e4207dfeebd6d34de70afea')
-    
-    # Format keywords with delimiter
-    formatted_keywords = ',5,'.join(keywords) + ',5'
-    
-    # Build request
-    url = f"{base_url}/ws/{platform.lower()}/star/search"
-    params = {
-        'followerGte': min_followers,
-        'followerLte': max_followers,
-        'country': countries,
-        'language': language,
-        'pageNum': 1,
-        'pageSize': min(limit, 200),  # Cap at 200 for API limits
-        'searchWords': formatted_keywords
-    }
-    headers = {'uid': uid}
-    
-    # Make request
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status != 200:
-                    return f"API error: {response.status}"
-                
-                data = await response.json()
-                
-                # Parse response
-                if data.get('errorNum') != 0 or 'retDataList' not in data:
-                    return "No results found"
-                
-                influencers = data['retDataList']
-                if not influencers:
-                    return f"No {platform} influencers found for '{', '.join(keywords)}'"
-                
-                # Format results
-                results = [f"Found {len(influencers)} {platform} influencers for '{', '.join(keywords)}':\n"]
-                
-                for i, inf in enumerate(influencers, 1):
-                    name = inf.get('nickName') or 'Unknown'
-                    country = inf.get('country') or 'Unknown'
-                    followers = inf.get('followers') or 0
-                    average_views = inf.get('estimateVideoViews') or 0
-                    score = inf.get('noxScore') or 0
-                    
-                    # Special handling for engagement to avoid None * 100 error
-                    interactive_rate = inf.get('interactiveRate')
-                    engagement = (0 if interactive_rate is None else interactive_rate) * 100
-                    
-                    results.append(f"{i}. {name}")
-                    results.append(f"   Platform: {platform}")
-                    results.append(f"   Followers: {followers:,}")
-                    results.append(f"   Location: {country}")
-                    results.append(f"   Engagement: {engagement:.2f}%")
-                    results.append(f"   Average Views: {average_views:,}")
-                    results.append(f"   Nox Score: {score:.2f}\n")
-                
-                search_summary = f"Found {len(influencers)} {platform} influencers for '{', '.join(keywords)}', with {min_followers} to {max_followers} followers, in {countries} countries, in {language} language:\n"
-                return search_summary + "\n".join(results)
-                
-    except Exception as e:
-        return f"Search failed: {str(e)}"
+# Research Utilities
+# ==================
 
 def get_notes_from_tool_calls(supervisor_messages) -> list:
     """Extract notes from supervisor tool calls for final report."""
@@ -294,41 +208,21 @@ def get_notes_from_tool_calls(supervisor_messages) -> list:
     return notes
 
 
-def get_api_key_for_model(model_name: str, config) -> str:
-    """Get appropriate API key for the specified model."""
-    import os
-    
-    # For GPT models (including GPT-5), use the OPENAI_API_KEY
-    if "gpt" in model_name.lower():
-        return os.getenv("OPENAI_API_KEY", "")
-    
-    # For Gemini models, use the GEMINI_API_KEY
-    if "gemini" in model_name.lower():
-        return os.getenv("GEMINI_API_KEY", "")
-    
-    # Add other model API key logic here as needed
-    return ""
+# Common token limit error patterns, matched in a single case-insensitive scan
+_TOKEN_LIMIT_PATTERN = re.compile(
+    "token limit|context length|maximum tokens|too many tokens|input too long",
+    re.IGNORECASE
+)
 
 
 def is_token_limit_exceeded(exception: Exception, model_name: str) -> bool:
     """Check if the exception indicates token limit was exceeded."""
-    error_message = str(exception).lower()
-    
-    # Common token limit error patterns
-    token_limit_indicators = [
-        "token limit",
-        "context length",
-        "maximum tokens",
-        "too many tokens",
-        "input too long"
-    ]
-    
-    return any(indicator in error_message for indicator in token_limit_indicators)
+    return _TOKEN_LIMIT_PATTERN.search(str(exception)) is not None
 
 # Individual Researcher Prompts
 # ==============================
 
-research_system_prompt = """You are an expert influencer marketing researcher conducting focused research on a specific topic. Today's date is {date}.
+research_system_prompt = """You are an expert influencer marketing researcher conducting focused research on a specific topic.
 
 <Task>
 Your job is to use tools to gather comprehensive information about the user's influencer marketing research topic.
@@ -382,13 +276,17 @@ After each search tool call, use think_tool to analyze the results:
 - Should I search more or call ResearchComplete?
 </Show Your Thinking>
 
-Remember: Use think_tool strategically for planning and assessment. Focus on gathering high-quality, actionable insights for influencer marketing decisions."""
+Remember: Use think_tool strategically for planning and assessment. Focus on gathering high-quality, actionable insights for influencer marketing decisions.
+
+Today's date is {date}."""
+
+render_research_system_prompt = compile_prompt_template(research_system_prompt)
 
 
 # Research Compression Prompts  
 # =============================
 
-compress_research_system_prompt = """You are an expert research synthesizer specializing in influencer marketing intelligence. You have conducted research on a topic by calling several tools and web searches. Your job is now to clean up the findings, but preserve all of the relevant statements and information that the researcher has gathered. Today's date is {date}.
+compress_research_system_prompt = """You are an expert research synthesizer specializing in influencer marketing intelligence. You have conducted research on a topic by calling several tools and web searches. Your job is now to clean up the findings, but preserve all of the relevant statements and information that the researcher has gathered.
 
 <Task>
 You need to clean up information gathered from tool calls and web searches in the existing messages.
@@ -423,7 +321,11 @@ The report should be structured like this:
   [2] Source Title: URL
 </Citation Rules>
 
-Critical Reminder: It is extremely important that any information that is even remotely relevant to the user's influencer marketing research topic is preserved verbatim (e.g. don't rewrite it, don't summarize it, don't paraphrase it)."""
+Critical Reminder: It is extremely important that any information that is even remotely relevant to the user's influencer marketing research topic is preserved verbatim (e.g. don't rewrite it, don't summarize it, don't paraphrase it).
+
+Today's date is {date}."""
+
+render_compress_research_system_prompt = compile_prompt_template(compress_research_system_prompt)
 
 compress_research_simple_human_message = """All above messages are about influencer marketing research conducted by an AI Researcher. Please clean up these findings.
 
@@ -463,6 +365,28 @@ def remove_up_to_last_ai_message(messages):
         return messages
 
 
+def cacheable_system_message(content: str, model_name: str) -> SystemMessage:
+    """Build a system message marked for provider-side prompt caching.
+    
+    Anthropic only caches up to explicit breakpoints, so the system prompt is sent
+    as a content block with an ephemeral cache_control marker. Its cached prefix
+    also covers the bound tool schemas, which precede the system prompt. Other
+    providers cache identical prefixes automatically and get a plain message.
+    
+    Args:
+        content: System prompt text
+        model_name: Model identifier, e.g. "anthropic:claude-sonnet-4"
+        
+    Returns:
+        SystemMessage with cache markers where the provider needs them
+    """
+    if model_name.lower().startswith("anthropic:"):
+        return SystemMessage(content=[
+            {"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}
+        ])
+    return SystemMessage(content=content)
+
+
 def openai_websearch_called(message):
     """Check if OpenAI native web search was called."""
     # Placeholder for OpenAI web search detection
@@ -563,6 +487,11 @@ Format the report in clear markdown with proper structure and include source ref
 </Citation Rules>
 """
 
+# Everything except the findings is fixed for a given report run, so the prompt is
+# split around {findings}: the prefix is formatted once and the findings spliced in.
+FINAL_REPORT_PROMPT_PREFIX, _, FINAL_REPORT_PROMPT_SUFFIX = FINAL_REPORT_GENERATION_PROMPT.partition("{findings}")
+render_final_report_prompt_prefix = compile_prompt_template(FINAL_REPORT_PROMPT_PREFIX)
+
 
 # Token Management and Model Utilities
 # ====================================
@@ -595,4 +524,19 @@ def get_model_token_limit(model_name: str) -> Optional[int]:
             return limit
     
     # Return None if model not found (will trigger error handling)
-    return None
\ No newline at end of file
+    return None
+
+
+# Research tools moved to agent.influencer_search.tools; resolved on first access
+# so importing prompts does not load the tool machinery
+_TOOL_EXPORTS = frozenset({
+    "think_tool",
+    "influencer_search_tool",
+})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _TOOL_EXPORTS:
+        from agent.influencer_search import tools
+        return getattr(tools, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
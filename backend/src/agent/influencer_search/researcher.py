@@ -8,8 +8,10 @@ Separated from main nodes.py for better code organization and maintainability.
 
 import logging
 import asyncio
+import random
+from contextlib import nullcontext
+from functools import cache, lru_cache
 from typing import Literal
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
 from langgraph.types import Command
@@ -20,14 +22,17 @@ from .state import ResearcherState, ResearcherInputState, ResearcherOutputState
 from .schemas import InfluencerResearchComplete
 from .prompts import (
     get_today_str,
-    think_tool,
-    influencer_search_tool,
+    render_research_system_prompt,
+    render_compress_research_system_prompt,
+    compress_research_simple_human_message,
+    cacheable_system_message,
     is_token_limit_exceeded,
-    filter_messages,
     remove_up_to_last_ai_message,
     openai_websearch_called,
     anthropic_websearch_called
 )
+from .tools import think_tool, influencer_search_tool
+from ..utils.runtime import get_or_create_model, get_llm_semaphore
 from ..configuration import Configuration
 
 # Setup logging
@@ -37,6 +42,28 @@ logger = logging.getLogger(__name__)
 # Individual Researcher Node Functions
 # ====================================
 
+@lru_cache(maxsize=16)
+def get_researcher_system_message(mcp_prompt: str, date: str, model_name: str) -> SystemMessage:
+    """Build the researcher system message for the given MCP context and date.
+    
+    The prompt is stable for a run, so the formatted message is built once and
+    the same instance is prepended on every ReAct turn, keeping the prompt
+    prefix byte-identical for provider-side caching.
+    
+    Args:
+        mcp_prompt: Additional MCP tool instructions, or an empty string
+        date: Current date string from get_today_str()
+        model_name: Researcher model identifier, used to pick cache markers
+        
+    Returns:
+        SystemMessage containing the formatted researcher prompt
+    """
+    return cacheable_system_message(
+        render_research_system_prompt(mcp_prompt=mcp_prompt, date=date),
+        model_name
+    )
+
+
 async def researcher(state: ResearcherState, config: RunnableConfig) -> Command[Literal["researcher_tools"]]:
     """Individual researcher that conducts focused research on specific topics.
     
@@ -59,48 +86,35 @@ async def researcher(state: ResearcherState, config: RunnableConfig) -> Command[
         researcher_messages = state.get("researcher_messages", [])
         
         # Get all available research tools (search, MCP, think_tool)
-        tools = await get_all_tools(config)
+        tools, invokers_by_name = await get_cached_tools(config)
         if len(tools) == 0:
             raise ValueError(
                 "No tools found to conduct research: Please configure either your "
                 "search API or add MCP tools to your configuration."
             )
         
-        logger.info(f"📦 Available research tools: {[tool.name if hasattr(tool, 'name') else 'web_search' for tool in tools]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📦 Available research tools: %s", list(invokers_by_name))
         
         # Step 2: Configure the researcher model with tools
-        # Prepare system prompt with MCP context if available
-        from .prompts import research_system_prompt
-        researcher_prompt = research_system_prompt.format(
-            mcp_prompt=configurable.mcp_prompt or "", 
-            date=get_today_str()
+        # Reuse the same system message for every turn with this MCP context and date
+        system_message = get_researcher_system_message(
+            configurable.mcp_prompt or "", get_today_str(), configurable.default_model
         )
         
-        # Simple model initialization with tool binding
-        # Pass API key explicitly for Google GenAI to avoid default credentials lookup
-        model_kwargs = {
-            "model": configurable.default_model,
-            "temperature": 0.0,
-        }
-        
-        # Add API key for Google GenAI models
-        if "google_genai" in configurable.default_model:
-            import os
-            api_key = os.getenv("GEMINI_API_KEY")
-            if api_key:
-                model_kwargs["api_key"] = api_key
-        
+        # Bind tools onto the pooled model client
         research_model = (
-            init_chat_model(**model_kwargs)
+            get_or_create_model(configurable.default_model, 0.0)
             .bind_tools(tools)
             .with_retry(stop_after_attempt=configurable.max_structured_output_retries)
         )
         
         # Step 3: Generate researcher response with system context
-        messages = [SystemMessage(content=researcher_prompt)] + researcher_messages
-        response = await research_model.ainvoke(messages)
+        messages = [system_message] + researcher_messages
+        async with get_llm_semaphore(configurable.max_llm_concurrency):
+            response = await research_model.ainvoke(messages)
         
-        logger.info(f"🎯 Researcher generated response with {len(response.tool_calls) if response.tool_calls else 0} tool calls")
+        logger.info("🎯 Researcher generated response with %d tool calls", len(response.tool_calls) if response.tool_calls else 0)
         
         # Step 4: Update state and proceed to tool execution
         return Command(
@@ -112,7 +126,7 @@ async def researcher(state: ResearcherState, config: RunnableConfig) -> Command[
         )
         
     except Exception as e:
-        logger.error(f"Error in researcher node: {e}")
+        logger.error("Error in researcher node: %s", e)
         # Return error state - will be handled by compression
         return Command(
             goto="compress_research",
@@ -128,7 +142,7 @@ async def researcher_tools(state: ResearcherState, config: RunnableConfig) -> Co
     This function handles various types of researcher tool calls:
     1. think_tool - Strategic reflection that continues the research conversation
     2. influencer_search_tool - Influencer search
-    3. ResearchComplete - Signals completion of individual research task
+    3. InfluencerResearchComplete - Signals completion of individual research task
     
     Args:
         state: Current researcher state with messages and iteration count
@@ -158,51 +172,84 @@ async def researcher_tools(state: ResearcherState, config: RunnableConfig) -> Co
         
         # Step 2: Handle tool calls if they exist
         all_tool_messages = []
-        
-        if has_tool_calls:
-            # Get all available research tools
-            available_tools = await get_all_tools(config)
-            tools_by_name = {
-                tool.name if hasattr(tool, "name") else tool.get("name", "web_search"): tool 
-                for tool in available_tools
-            }
+        tool_calls = most_recent_message.tool_calls
+        
+        # Split local reflections from toolkit calls in a single pass
+        local_calls, toolkit_calls = [], []
+        research_complete_called = False
+        for tool_call in tool_calls:
+            name = tool_call["name"]
+            if name in _LOCAL_TOOL_NAMES:
+                local_calls.append(tool_call)
+            else:
+                toolkit_calls.append(tool_call)
+                if name == "InfluencerResearchComplete":
+                    research_complete_called = True
+        
+        # Completion ends research, so sibling searches would only be discarded
+        if research_complete_called:
+            # Only run cheap local reflections; stub the rest to keep the conversation well-formed
+            calls_to_execute = local_calls
+            all_tool_messages = [
+                ToolMessage(
+                    content="skipped: research complete",
+                    name=tool_call["name"],
+                    tool_call_id=tool_call["id"]
+                )
+                for tool_call in toolkit_calls
+            ]
+        else:
+            calls_to_execute = tool_calls
+        
+        if calls_to_execute:
+            # Reflection-only turns dispatch locally without touching the configured toolkit
+            if research_complete_called or not toolkit_calls:
+                invokers_by_name = _LOCAL_INVOKERS
+            else:
+                # Get the cached name -> invoker index for dispatch
+                _, invokers_by_name = await get_cached_tools(config)
             
             # Execute all tool calls in parallel
-            tool_calls = most_recent_message.tool_calls
-            logger.info(f"🔧 Executing {len(tool_calls)} tool calls in parallel")
+            logger.info("🔧 Executing %d tool calls in parallel", len(calls_to_execute))
+            
+            # Bound this turn's parallelism so large fan-outs apply backpressure to the search API
+            tool_semaphore = asyncio.Semaphore(configurable.max_concurrent_tool_calls)
             
-            tool_execution_tasks = [
-                execute_tool_safely(tools_by_name.get(tool_call["name"]), tool_call["args"], config) 
-                for tool_call in tool_calls
-                if tool_call["name"] in tools_by_name
+            dispatched_calls = [
+                tool_call for tool_call in calls_to_execute
+                if tool_call["name"] in invokers_by_name
             ]
+            results = await asyncio.gather(*(
+                execute_tool_safely(
+                    tool_call["name"], invokers_by_name[tool_call["name"]], tool_call["args"], config,
+                    semaphore=tool_semaphore
+                )
+                for tool_call in dispatched_calls
+            ))
             
-            if tool_execution_tasks:
-                observations = await asyncio.gather(*tool_execution_tasks)
-                
-                # Create tool messages from execution results
-                all_tool_messages = [
-                    ToolMessage(
-                        content=str(observation),
-                        name=tool_call["name"],
-                        tool_call_id=tool_call["id"]
-                    ) 
-                    for observation, tool_call in zip(observations, tool_calls)
-                    if tool_call["name"] in tools_by_name
-                ]
-                
-                logger.info(f"✅ Processed {len(all_tool_messages)} tool executions")
+            all_tool_messages.extend(
+                ToolMessage(
+                    content=str(result),
+                    name=tool_call["name"],
+                    tool_call_id=tool_call["id"]
+                )
+                for tool_call, result in zip(dispatched_calls, results)
+            )
+            
+            # Emit results in tool_calls order: Gemini pairs function responses with calls
+            # by position and name only, and a stable order keeps the history prefix cacheable
+            call_positions = {tool_call["id"]: index for index, tool_call in enumerate(tool_calls)}
+            all_tool_messages.sort(key=lambda message: call_positions[message.tool_call_id])
+            
+            if all_tool_messages:
+                logger.info("✅ Processed %d tool executions", len(all_tool_messages))
         
         # Step 3: Check late exit conditions (after processing tools)
         exceeded_iterations = state.get("tool_call_iterations", 0) >= configurable.max_react_tool_calls
-        research_complete_called = any(
-            tool_call["name"] == "ResearchComplete" 
-            for tool_call in most_recent_message.tool_calls
-        ) if has_tool_calls else False
         
         if exceeded_iterations or research_complete_called:
             # End research and proceed to compression
-            logger.info(f"🏁 Ending research - iterations: {state.get('tool_call_iterations', 0)}, complete: {research_complete_called}")
+            logger.info("🏁 Ending research - iterations: %s, complete: %s", state.get('tool_call_iterations', 0), research_complete_called)
             return Command(
                 goto="compress_research",
                 update={"researcher_messages": all_tool_messages} if all_tool_messages else {}
@@ -216,7 +263,7 @@ async def researcher_tools(state: ResearcherState, config: RunnableConfig) -> Co
         )
         
     except Exception as e:
-        logger.error(f"Error in researcher_tools: {e}")
+        logger.error("Error in researcher_tools: %s", e)
         # On error, proceed to compression
         return Command(
             goto="compress_research",
@@ -240,114 +287,114 @@ async def compress_research(state: ResearcherState, config: RunnableConfig):
     """
     logger.info("🗜️ Starting research compression")
     
+    # Extract raw notes from all tool and AI messages once for every return path
+    researcher_messages = state.get("researcher_messages", [])
+    raw_notes_content = "\n".join(
+        str(message.content) 
+        for message in researcher_messages 
+        if isinstance(message, (ToolMessage, AIMessage))
+    )
+    
+    configurable = Configuration.from_runnable_config(config)
+    
     # 直接跳过压缩逻辑 - 极简实现，不调用大模型
-    try:
-        researcher_messages = state.get("researcher_messages", [])
-        
-        # 使用相同的逻辑提取原始内容
-        raw_notes_content = "\n".join([
-            str(message.content) 
-            for message in filter_messages(researcher_messages, include_types=["tool", "ai"])
-        ])
-        
-        # 直接拼装简单的研究摘要，不调用大模型
-        tool_call_count = len([m for m in researcher_messages if hasattr(m, 'tool_calls') and m.tool_calls])
-        compressed_summary = f"Research completed with {tool_call_count} tool executions."
-        
-        if raw_notes_content.strip():
-            # 取前500字符作为简要摘要
-            preview = raw_notes_content.strip()[:500]
-            if len(raw_notes_content) > 500:
-                preview += "..."
-            compressed_summary += f"\n\nFindings:\n{preview}"
-        
-        logger.info("✅ Research compression bypassed - returning direct results")
-        
-        # 返回与其他节点匹配的格式
-        return {
-            "compressed_research": compressed_summary,
-            "raw_notes": [raw_notes_content]
-        }
-        
-    except Exception:
-        # 如果极简实现失败，继续执行原压缩逻辑
-        logger.error("Research compression bypassed failed")
-        pass
+    # The LLM compression below only runs when enable_research_compression is set
+    if not configurable.enable_research_compression:
+        try:
+            # 直接拼装简单的研究摘要，不调用大模型
+            tool_call_count = sum(1 for m in researcher_messages if getattr(m, 'tool_calls', None))
+            compressed_summary = f"Research completed with {tool_call_count} tool executions."
+            
+            stripped_notes = raw_notes_content.strip()
+            if stripped_notes:
+                # 取前500字符作为简要摘要
+                preview = stripped_notes[:500]
+                if len(raw_notes_content) > 500:
+                    preview += "..."
+                compressed_summary += f"\n\nFindings:\n{preview}"
+            
+            logger.info("✅ Research compression bypassed - returning direct results")
+            
+            # 返回与其他节点匹配的格式
+            return {
+                "compressed_research": compressed_summary,
+                "raw_notes": [raw_notes_content]
+            }
+            
+        except Exception:
+            # 如果极简实现失败，继续执行原压缩逻辑
+            logger.error("Research compression bypassed failed")
+            pass
     
     try:
         # Step 1: Simple compression model configuration
-        configurable = Configuration.from_runnable_config(config)
-        
-        # Pass API key explicitly for Google GenAI to avoid default credentials lookup
-        model_kwargs = {
-            "model": configurable.default_model,
-            "temperature": 0.0,
-        }
-        
-        # Add API key for Google GenAI models
-        if "google_genai" in configurable.default_model:
-            import os
-            api_key = os.getenv("GEMINI_API_KEY")
-            if api_key:
-                model_kwargs["api_key"] = api_key
-        
-        synthesizer_model = init_chat_model(**model_kwargs)
+        synthesizer_model = get_or_create_model(configurable.default_model, 0.0)
         
         # Step 2: Prepare messages for compression
-        researcher_messages = state.get("researcher_messages", [])
-        
-        # Add instruction to switch from research mode to compression mode
-        from .prompts import compress_research_simple_human_message
-        researcher_messages.append(HumanMessage(content=compress_research_simple_human_message))
+        # Work on a local copy so the switch to compression mode never mutates graph state
+        compression_messages = [
+            *researcher_messages,
+            HumanMessage(content=compress_research_simple_human_message)
+        ]
+        
+        # The compression system prompt is the same for every attempt
+        system_message = cacheable_system_message(
+            render_compress_research_system_prompt(date=get_today_str()),
+            configurable.default_model
+        )
         
         # Step 3: Attempt compression with retry logic for token limit issues
         synthesis_attempts = 0
         max_attempts = 3
+        backoff_base = 1.0
+        backoff_jitter = 1.0
         
         while synthesis_attempts < max_attempts:
             try:
-                # Create system prompt focused on compression task
-                from .prompts import compress_research_system_prompt
-                compression_prompt = compress_research_system_prompt.format(date=get_today_str())
-                messages = [SystemMessage(content=compression_prompt)] + researcher_messages
+                messages = [system_message, *compression_messages]
                 
                 # Execute compression
                 logger.info("🤖 Generating compressed research summary...")
-                response = await synthesizer_model.ainvoke(messages)
-                
-                # Extract raw notes from all tool and AI messages
-                raw_notes_content = "\n".join([
-                    str(message.content) 
-                    for message in filter_messages(researcher_messages, include_types=["tool", "ai"])
-                ])
+                # Queue for an LLM slot outside the timeout so waiting is not counted
+                async with get_llm_semaphore(configurable.max_llm_concurrency):
+                    compressed_research = await asyncio.wait_for(
+                        _stream_compression(synthesizer_model, messages),
+                        timeout=configurable.compression_timeout
+                    )
                 
                 logger.info("✅ Research compression completed successfully")
                 
                 # Return successful compression result
                 return {
-                    "compressed_research": str(response.content),
+                    "compressed_research": compressed_research,
                     "raw_notes": [raw_notes_content]
                 }
                 
+            except asyncio.TimeoutError:
+                synthesis_attempts += 1
+                logger.warning(
+                    "Compression attempt %d timed out after %ss",
+                    synthesis_attempts,
+                    configurable.compression_timeout
+                )
+                
             except Exception as e:
                 synthesis_attempts += 1
-                logger.warning(f"Compression attempt {synthesis_attempts} failed: {e}")
+                logger.warning("Compression attempt %d failed: %s", synthesis_attempts, e)
                 
                 # Handle token limit exceeded by removing older messages
                 if is_token_limit_exceeded(e, configurable.default_model):
-                    researcher_messages = remove_up_to_last_ai_message(researcher_messages)
+                    compression_messages = remove_up_to_last_ai_message(compression_messages)
                     logger.info("Reduced message history due to token limit")
                     continue
-                
-                # For other errors, continue retrying
-                continue
+            
+            # Back off with jitter before retrying timeouts and transient errors
+            if synthesis_attempts < max_attempts:
+                await asyncio.sleep(
+                    backoff_base * 2 ** (synthesis_attempts - 1) + random.uniform(0, backoff_jitter)
+                )
         
         # Step 4: Return error result if all attempts failed
-        raw_notes_content = "\n".join([
-            str(message.content) 
-            for message in filter_messages(researcher_messages, include_types=["tool", "ai"])
-        ])
-        
         logger.error("Research compression failed after maximum retries")
         return {
             "compressed_research": "Error synthesizing research report: Maximum retries exceeded",
@@ -355,14 +402,68 @@ async def compress_research(state: ResearcherState, config: RunnableConfig):
         }
         
     except Exception as e:
-        logger.error(f"Critical error in compress_research: {e}")
+        logger.error("Critical error in compress_research: %s", e)
         # Fallback result
         return {
             "compressed_research": f"Error in research compression: {str(e)}",
             "raw_notes": [f"Error processing research data: {str(e)}"]
         }
 
+# Assembled (tools, invokers_by_name) pairs keyed by the configuration fields that determine them
+_TOOLS_CACHE: dict[tuple, tuple[list, dict]] = {}
+_TOOLS_LOCKS: dict[tuple, asyncio.Lock] = {}
+
+
+async def get_cached_tools(config: RunnableConfig) -> tuple[list, dict]:
+    """Get the research toolkit and its dispatch index, assembling them once per tool configuration.
+    
+    Every researcher turn needs the toolkit, so the assembled list and the
+    name -> async invoker mapping used for dispatch are cached and shared
+    across turns and researchers. A per-key lock keeps concurrent researchers from
+    assembling the same toolkit in parallel on first use.
+    
+    Args:
+        config: Runtime configuration specifying search API and MCP settings
+        
+    Returns:
+        Tuple of (tools, invokers_by_name)
+    """
+    configurable = Configuration.from_runnable_config(config)
+    # Only the search API selects tools today; MCP settings belong here once MCP tools are loaded
+    cache_key = (configurable.search_api,)
+    
+    cached = _TOOLS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    async with _TOOLS_LOCKS.setdefault(cache_key, asyncio.Lock()):
+        if cache_key not in _TOOLS_CACHE:
+            tools = await _assemble_tools(config)
+            invokers_by_name = {_tool_name(tool): _make_invoker(tool) for tool in tools}
+            _TOOLS_CACHE[cache_key] = (tools, invokers_by_name)
+    
+    return _TOOLS_CACHE[cache_key]
+
+
 async def get_all_tools(config: RunnableConfig):
+    """Get the complete research toolkit for the given configuration.
+    
+    Args:
+        config: Runtime configuration specifying search API and MCP settings
+        
+    Returns:
+        List of all configured and available tools for research operations
+    """
+    tools, _ = await get_cached_tools(config)
+    return tools
+
+
+def _tool_name(tool) -> str:
+    """Resolve a tool's dispatch name; provider-native tools are plain dict specs."""
+    return tool.get("name", "web_search") if isinstance(tool, dict) else tool.name
+
+
+async def _assemble_tools(config: RunnableConfig):
     """Assemble complete toolkit including research, search, and MCP tools.
     
     Args:
@@ -378,57 +479,130 @@ async def get_all_tools(config: RunnableConfig):
     
     tools.extend([influencer_search_tool])
    
-    logger.info(f"🔧 Assembled {len(tools)} research tools: {[tool.name if hasattr(tool, 'name') else 'unkown tool' for tool in tools]}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("🔧 Assembled %d research tools: %s", len(tools), [_tool_name(tool) for tool in tools])
     
     return tools
 
 
-async def execute_tool_safely(tool, args, config):
-    """Safely execute a tool with error handling."""
+async def _stream_compression(model, messages) -> str:
+    """Stream a compression response and return the accumulated text."""
+    response = None
+    async for chunk in model.astream(messages):
+        response = chunk if response is None else response + chunk
+    return str(response.content) if response is not None else ""
+
+
+# Per-tool execution budgets in seconds, so one slow call cannot stall a researcher turn
+TOOL_TIMEOUTS = {
+    "influencer_search_tool": 30,
+    "think_tool": 5,
+}
+DEFAULT_TOOL_TIMEOUT = 30
+
+
+def _make_invoker(tool):
+    """Choose a tool's async call path once, when the toolkit is assembled."""
+    if hasattr(tool, 'ainvoke'):
+        return tool.ainvoke
+    
+    if hasattr(tool, 'invoke'):
+        async def invoke_in_executor(args, config):
+            return await asyncio.get_running_loop().run_in_executor(None, tool.invoke, args)
+        return invoke_in_executor
+    
+    if callable(tool):
+        async def call_tool(args, config):
+            return tool(**args)
+        return call_tool
+    
+    async def not_callable(args, config):
+        return f"Error: Tool {tool} is not callable"
+    return not_callable
+
+
+# Local tools that need no search or MCP configuration
+_LOCAL_INVOKERS = {"think_tool": _make_invoker(think_tool)}
+_LOCAL_TOOL_NAMES = frozenset(_LOCAL_INVOKERS)
+
+
+async def execute_tool_safely(tool_name, invoker, args, config, semaphore=None):
+    """Safely execute a tool through its precomputed invoker with error handling.
+    
+    When a semaphore is given, the call waits for a free slot before running.
+    """
     try:
-        if tool is None:
+        if invoker is None:
             return "Error: Tool not found or not configured"
         
-        logger.info(f"🔧 Executing tool: {tool.name if hasattr(tool, 'name') else 'unknown'}")
-        
-        if hasattr(tool, 'ainvoke'):
-            result = await tool.ainvoke(args, config)
-        elif hasattr(tool, 'invoke'):
-            result = tool.invoke(args)
-        elif callable(tool):
-            result = tool(**args)
-        else:
-            return f"Error: Tool {tool} is not callable"
+        async with semaphore or nullcontext():
+            logger.info("🔧 Executing tool: %s", tool_name)
+            
+            timeout = TOOL_TIMEOUTS.get(tool_name, DEFAULT_TOOL_TIMEOUT)
+            result = await asyncio.wait_for(invoker(args, config), timeout=timeout)
         
-        logger.info(f"✅ Tool execution completed")
+        logger.info("✅ Tool execution completed")
         return result
         
+    except asyncio.TimeoutError:
+        logger.error("❌ Tool %s timed out after %ss", tool_name, timeout)
+        return f"Error: tool timed out after {timeout}s"
+        
     except Exception as e:
-        logger.error(f"❌ Tool execution failed: {e}")
+        logger.error("❌ Tool execution failed: %s", e)
         return f"Error executing tool: {str(e)}"
 
 
 # Researcher Subgraph Construction
 # ================================
 
-# Creates individual researcher workflow for conducting focused research on specific topics
-researcher_builder = StateGraph(
-    ResearcherState, 
-    input=ResearcherInputState,
-    output=ResearcherOutputState, 
-    config_schema=Configuration
-)
-
-# Add researcher nodes for research execution and compression
-researcher_builder.add_node("researcher", researcher)                 # Main researcher logic
-researcher_builder.add_node("researcher_tools", researcher_tools)     # Tool execution handler  
-researcher_builder.add_node("compress_research", compress_research)   # Research compression
-
-# Define researcher workflow edges
-researcher_builder.add_edge(START, "researcher")           # Entry point to researcher
-researcher_builder.add_edge("compress_research", END)      # Exit point after compression
+@cache
+def get_researcher_subgraph():
+    """Build and compile the researcher subgraph on first use.
+    
+    The graph structure does not depend on runtime configuration, so it is
+    compiled once per process when the supervisor first dispatches research
+    rather than at import time.
+    
+    Returns:
+        Compiled researcher subgraph for parallel execution by the supervisor
+    """
+    # Creates individual researcher workflow for conducting focused research on specific topics
+    researcher_builder = StateGraph(
+        ResearcherState, 
+        input=ResearcherInputState,
+        output=ResearcherOutputState, 
+        config_schema=Configuration
+    )
+    
+    # Add researcher nodes for research execution and compression
+    researcher_builder.add_node("researcher", researcher)                 # Main researcher logic
+    researcher_builder.add_node("researcher_tools", researcher_tools)     # Tool execution handler  
+    researcher_builder.add_node("compress_research", compress_research)   # Research compression
+    
+    # Define researcher workflow edges
+    researcher_builder.add_edge(START, "researcher")           # Entry point to researcher
+    researcher_builder.add_edge("compress_research", END)      # Exit point after compression
+    
+    researcher_subgraph = researcher_builder.compile()
+    
+    logger.info("🔬 Researcher subgraph compiled successfully")
+    return researcher_subgraph
 
-# Compile researcher subgraph for parallel execution by supervisor
-researcher_subgraph = researcher_builder.compile()
 
-logger.info("🔬 Researcher subgraph compiled successfully")
\ No newline at end of file
+async def run_researchers_batch(states: list, config: RunnableConfig, return_exceptions: bool = False) -> list:
+    """Run several researcher subgraphs as one batch.
+    
+    Args:
+        states: Researcher input states, one per delegated research task
+        config: Runtime configuration shared by every researcher in the batch
+        return_exceptions: Return a failed researcher's exception in its slot instead of raising
+        
+    Returns:
+        Researcher output states (or exceptions) in the same order as the inputs
+    """
+    configurable = Configuration.from_runnable_config(config)
+    batch_config = {**(config or {}), "max_concurrency": configurable.researcher_batch_size}
+    return await get_researcher_subgraph().abatch(
+        states, batch_config, return_exceptions=return_exceptions
+    )
@@ -5,6 +5,7 @@ Defines the state schema and data flow for the influencer search agent,
 following LangGraph best practices for subgraph state management.
 """
 
+from dataclasses import dataclass
 from typing import List, Optional
 from typing_extensions import TypedDict, Annotated
 import operator
@@ -15,13 +16,30 @@ from langchain_core.messages import BaseMessage, MessageLikeRepresentation
 # No legacy schema imports needed
 
 def override_reducer(current_value, new_value):
-    """Reducer function that allows overriding values in state."""
+    """Reducer function that allows overriding values in state.
+    
+    Nodes return only new items, so each step copies the list once. The result is
+    a new list on purpose: extending in place would mutate values already handed
+    to checkpoints and parent graphs.
+    """
     if isinstance(new_value, dict) and new_value.get("type") == "override":
         return new_value.get("value", new_value)
     else:
         return operator.add(current_value, new_value)
 
 
+@dataclass(slots=True, frozen=True)
+class ResearchMetadata:
+    """Campaign parameters extracted alongside the research brief."""
+    target_platforms: List[str]
+    niche_focus: str
+    campaign_objectives: List[str]
+    geographic_focus: Optional[str] = None
+    follower_range: Optional[str] = None
+    budget: Optional[str] = None
+    content_requirements: Optional[List[str]] = None
+
+
 class InfluencerSearchInputState(MessagesState):
     """
     Input state for influencer search agent.
@@ -44,9 +62,12 @@ class InfluencerSearchState(MessagesState):
     research_brief: Optional[str] = None
     """Generated research brief for influencer marketing campaign"""
     
-    research_metadata: Optional[dict] = None
+    research_metadata: Optional[ResearchMetadata] = None
     """Structured metadata from research brief generation"""
     
+    messages_buffer: Optional[str] = None
+    """Conversation rendered once per turn, reused by write_research_brief and final_report_generation"""
+    
     supervisor_messages: Annotated[List[MessageLikeRepresentation], override_reducer] = []
     """Messages for supervisor conversation (accumulated)"""
     
@@ -87,15 +108,16 @@ class SupervisorState(TypedDict):
 
 class ResearcherInputState(TypedDict):
     """Input state for individual researcher agents."""
-    researcher_messages: Annotated[List[MessageLikeRepresentation], override_reducer]
+    researcher_messages: Annotated[List[MessageLikeRepresentation], operator.add]
     research_task_brief: str
 
 class ResearcherState(TypedDict):
     """Complete state for individual researcher workflow."""
+    # Nodes return only the new messages; the reducer must build a new list rather
+    # than extend in place, because channel copies and async checkpoint writes share it
     researcher_messages: Annotated[List[MessageLikeRepresentation], operator.add]
     tool_call_iterations: int = 0
     research_task_brief: str
-    tool_call_iterations: int
 
 
 class ResearcherOutputState(TypedDict):
@@ -8,8 +8,8 @@ for better code organization and maintainability.
 
 import logging
 import asyncio
+from functools import lru_cache
 from typing import Literal
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
 from langgraph.types import Command
@@ -20,15 +20,41 @@ from .state import SupervisorState
 from .schemas import ConductInfluencerResearch, InfluencerResearchComplete
 from .prompts import (
     get_notes_from_tool_calls,
-    is_token_limit_exceeded,
-    think_tool
+    is_token_limit_exceeded
 )
+from .tools import think_tool
+from ..utils.runtime import get_or_create_model, get_llm_semaphore
 from ..configuration import Configuration
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
+# Available tools: research delegation, completion signaling, and strategic thinking
+LEAD_RESEARCHER_TOOLS = [ConductInfluencerResearch, InfluencerResearchComplete, think_tool]
+
+
+@lru_cache(maxsize=16)
+def get_supervisor_model(model_name: str, max_retries: int):
+    """Get the supervisor model with tools and retries bound, built once per settings.
+    
+    Binding tools converts every tool schema to the provider format, so the bound
+    runnable is cached instead of being rebuilt on each supervisor turn.
+    
+    Args:
+        model_name: Model identifier in provider:model format
+        max_retries: Maximum attempts for the model call
+        
+    Returns:
+        Runnable supervisor model ready for ainvoke
+    """
+    return (
+        get_or_create_model(model_name, 0.0)
+        .bind_tools(LEAD_RESEARCHER_TOOLS)
+        .with_retry(stop_after_attempt=max_retries)
+    )
+
+
 async def supervisor(state: SupervisorState, config: RunnableConfig) -> Command[Literal["supervisor_tools"]]:
     """Lead influencer marketing research supervisor that plans research strategy and delegates to researchers.
     
@@ -43,40 +69,24 @@ async def supervisor(state: SupervisorState, config: RunnableConfig) -> Command[
     Returns:
         Command to proceed to supervisor_tools for tool execution
     """
-    logger.info("🎯 Influencer marketing research supervisor activated")
+    logger.debug("🎯 Influencer marketing research supervisor activated")
     
     # Step 1: Configure the supervisor model with available tools
     configurable = Configuration.from_runnable_config(config)
     
-    # Available tools: research delegation, completion signaling, and strategic thinking
-    lead_researcher_tools = [ConductInfluencerResearch, InfluencerResearchComplete, think_tool]
-    
-    # Simple model initialization with tool binding
-    # Pass API key explicitly for Google GenAI to avoid default credentials lookup
-    model_kwargs = {
-        "model": configurable.default_model,
-        "temperature": 0.0,
-    }
-    
-    # Add API key for Google GenAI models
-    if "google_genai" in configurable.default_model:
-        import os
-        api_key = os.getenv("GEMINI_API_KEY")
-        if api_key:
-            model_kwargs["api_key"] = api_key
-    
-    research_model = (
-        init_chat_model(**model_kwargs)
-        .bind_tools(lead_researcher_tools)
-        .with_retry(stop_after_attempt=configurable.max_structured_output_retries)
+    research_model = get_supervisor_model(
+        configurable.default_model,
+        configurable.max_structured_output_retries,
     )
     
     # Step 2: Generate supervisor response based on current context
     supervisor_messages = state.get("supervisor_messages", [])
-    logger.info(f"🔍 DEBUG - {len(supervisor_messages)} Supervisor messages: {supervisor_messages}")
-    response = await research_model.ainvoke(supervisor_messages)
+    logger.debug("🔍 %d supervisor messages: %s", len(supervisor_messages), supervisor_messages)
+    async with get_llm_semaphore(configurable.max_llm_concurrency):
+        response = await research_model.ainvoke(supervisor_messages)
     
-    logger.info(f"🎯 Supervisor generated response with {len(response.tool_calls) if response.tool_calls else 0} tool calls, response={response}")
+    logger.info("🎯 Supervisor generated response with %d tool calls", len(response.tool_calls) if response.tool_calls else 0)
+    logger.debug("🎯 Supervisor response: %s", response)
     
     # Step 3: Update state and proceed to tool execution
     return Command(
@@ -88,54 +98,78 @@ async def supervisor(state: SupervisorState, config: RunnableConfig) -> Command[
     )
 
 
-def _should_end_research(state: SupervisorState, config: RunnableConfig) -> tuple[bool, dict]:
-    """Check if research phase should end based on exit conditions.
+def _classify_tool_calls(tool_calls: list) -> tuple[list, list, bool]:
+    """Split supervisor tool calls by tool name in a single pass.
     
+    Args:
+        tool_calls: Tool calls from the most recent supervisor message
+        
     Returns:
-        Tuple of (should_end, update_dict)
+        Tuple of (think_tool_calls, research_calls, research_complete); the
+        call lists are empty when research is complete, since nothing else runs
+    """
+    think_tool_calls, research_calls = [], []
+    for tool_call in tool_calls:
+        name = tool_call["name"]
+        if name == "think_tool":
+            think_tool_calls.append(tool_call)
+        elif name == "ConductInfluencerResearch":
+            research_calls.append(tool_call)
+        elif name == "InfluencerResearchComplete":
+            # Completion ends the phase, so the remaining calls need no classification
+            return [], [], True
+    
+    return think_tool_calls, research_calls, False
+
+
+def _end_research_update(state: SupervisorState) -> dict:
+    """Build the state update that closes the research phase."""
+    return {
+        "notes": get_notes_from_tool_calls(state.get("supervisor_messages", [])),
+        "research_brief": state.get("research_brief", "")
+    }
+
+
+def _should_end_research(state: SupervisorState, configurable: Configuration, tool_calls: list) -> bool:
+    """Check the exit conditions that need no scan of the tool calls.
+    
+    InfluencerResearchComplete is detected while classifying tool calls, which
+    only happens once these cheaper checks have passed.
+    
+    Args:
+        state: Current supervisor state
+        configurable: Parsed runtime configuration
+        tool_calls: Tool calls from the most recent supervisor message
+    
+    Returns:
+        Whether the research phase should end
     """
-    configurable = Configuration.from_runnable_config(config)
     supervisor_messages = state.get("supervisor_messages", [])
     research_iterations = state.get("research_iterations", 0)
-    most_recent_message = supervisor_messages[-1] if supervisor_messages else None
     
     # Check basic validation
-    if not most_recent_message or not hasattr(most_recent_message, 'tool_calls'):
+    if not supervisor_messages or not hasattr(supervisor_messages[-1], 'tool_calls'):
         logger.warning("No recent message or tool calls found, ending research")
-        return True, {
-            "notes": get_notes_from_tool_calls(supervisor_messages),
-            "research_brief": state.get("research_brief", "")
-        }
+        return True
     
     # Check exit criteria
-    exceeded_iterations = research_iterations > configurable.max_researcher_iterations
-    no_tool_calls = not most_recent_message.tool_calls
-    research_complete = any(
-        tool_call.get("name") == "InfluencerResearchComplete" 
-        for tool_call in most_recent_message.tool_calls
-    )
-    
-    if exceeded_iterations or no_tool_calls or research_complete:
-        logger.info(f"🏁 Ending research - iterations: {research_iterations}, complete: {research_complete}")
-        return True, {
-            "notes": get_notes_from_tool_calls(supervisor_messages),
-            "research_brief": state.get("research_brief", "")
-        }
+    if research_iterations > configurable.max_researcher_iterations or not tool_calls:
+        logger.info("🏁 Ending research - iterations: %d, tool calls: %d", research_iterations, len(tool_calls))
+        return True
     
-    return False, {}
+    return False
 
-def _process_think_tools(tool_calls: list) -> list[ToolMessage]:
+async def _process_think_tools(think_tool_calls: list) -> list[ToolMessage]:
     """Process think_tool calls and return corresponding tool messages.
     
     Args:
-        tool_calls: List of tool calls to process
+        think_tool_calls: List of think_tool calls to process
         
     Returns:
         List of ToolMessage objects for think_tool calls
     """
-    logger.info(f"🔍 Processing {len(tool_calls)} think_tool calls")
+    logger.debug("🔍 Processing %d think_tool calls", len(think_tool_calls))
     think_messages = []
-    think_tool_calls = [tc for tc in tool_calls if tc.get("name") == "think_tool"]
     
     for tool_call in think_tool_calls:
         reflection_content = tool_call["args"]["reflection"]
@@ -144,27 +178,29 @@ def _process_think_tools(tool_calls: list) -> list[ToolMessage]:
             name="think_tool",
             tool_call_id=tool_call["id"]
         ))
-        logger.info(f"💭 Processed strategic reflection: {reflection_content[:100]}...")
+        logger.debug("💭 Processed strategic reflection: %.100s...", reflection_content)
     
     return think_messages
 
-async def _process_research_tasks(tool_calls: list, config: RunnableConfig) -> tuple[list[ToolMessage], dict]:
+async def _process_research_tasks(
+    research_calls: list, 
+    configurable: Configuration, 
+    config: RunnableConfig
+) -> tuple[list[ToolMessage], dict]:
     """Process ConductInfluencerResearch calls with concurrent execution.
     
     Args:
-        tool_calls: List of tool calls to process
-        config: Runtime configuration
+        research_calls: List of ConductInfluencerResearch calls to process
+        configurable: Parsed runtime configuration
+        config: Runtime configuration passed through to the researchers
         
     Returns:
         Tuple of (tool_messages, update_payload)
     """
-    logger.info(f"🔍 Processing Research Tasks with {len(tool_calls)} tool calls")
-    research_calls = [tc for tc in tool_calls if tc.get("name") == "ConductInfluencerResearch"]
     if not research_calls:
         return [], {}
     
-    configurable = Configuration.from_runnable_config(config)
-    logger.info(f"🔍 Processing Research Tasks: {len(research_calls)} research delegation requests")
+    logger.info("🔍 Processing Research Tasks: %d research delegation requests", len(research_calls))
     
     # Apply concurrency limits
     allowed_calls = research_calls[:configurable.max_concurrent_research_units]
@@ -172,72 +208,83 @@ async def _process_research_tasks(tool_calls: list, config: RunnableConfig) -> t
     
     try:
         # Execute research tasks concurrently
-        from .researcher import researcher_subgraph
+        from .researcher import run_researchers_batch
         
-        research_tasks = [
-            researcher_subgraph.ainvoke({
+        researcher_inputs = [
+            {
                 "researcher_messages": [HumanMessage(content=tc["args"]["research_task_brief"])],
                 "research_task_brief": tc["args"]["research_task_brief"],
                 "tool_call_iterations": 0
-            }, config) 
+            }
             for tc in allowed_calls
         ]
         
-        logger.info(f"🚀 Executing {len(research_tasks)} research tasks concurrently")
-        tool_results = await asyncio.gather(*research_tasks)
-        logger.info(f"✅ Completed {len(tool_results)} concurrent research tasks")
+        logger.debug("🚀 Executing %d research tasks concurrently", len(researcher_inputs))
+        # A failed researcher must not discard the findings of its siblings
+        tool_results = await run_researchers_batch(researcher_inputs, config, return_exceptions=True)
+        logger.info("✅ Completed %d concurrent research tasks", len(tool_results))
+        
+        # Token limit failures still end the research phase
+        for observation in tool_results:
+            if isinstance(observation, Exception) and is_token_limit_exceeded(observation, configurable.default_model):
+                raise observation
         
-        # Create tool messages from results
+        # Create tool messages and collect raw notes in one pass, in delegation order
         tool_messages = []
+        raw_notes_parts = []
         for observation, tool_call in zip(tool_results, allowed_calls):
+            if isinstance(observation, Exception):
+                logger.warning("Research task failed: %s", observation)
+                content = f"Error executing research: {str(observation)}"
+            else:
+                content = observation.get("compressed_research", "Error synthesizing research report: Maximum retries exceeded")
+                raw_notes_parts.extend(observation.get("raw_notes", ()))
             tool_messages.append(ToolMessage(
-                content=observation.get("compressed_research", "Error synthesizing research report: Maximum retries exceeded"),
+                content=content,
                 name=tool_call.get("name", "ConductInfluencerResearch"),
                 tool_call_id=tool_call["id"]
             ))
         
         # Handle overflow calls
-        for overflow_call in overflow_calls:
-            tool_messages.append(ToolMessage(
-                content=f"Error: Did not run this research as you have already exceeded the maximum number of concurrent research units. Please try again with {configurable.max_concurrent_research_units} or fewer research units.",
+        overflow_message = f"Error: Did not run this research as you have already exceeded the maximum number of concurrent research units. Please try again with {configurable.max_concurrent_research_units} or fewer research units."
+        tool_messages.extend(
+            ToolMessage(
+                content=overflow_message,
                 name="ConductInfluencerResearch",
                 tool_call_id=overflow_call["id"]
-            ))
+            )
+            for overflow_call in overflow_calls
+        )
         
         # Aggregate raw notes
-        raw_notes = "\n".join([
-            "\n".join(observation.get("raw_notes", [])) 
-            for observation in tool_results
-        ])
+        raw_notes = "\n".join(raw_notes_parts)
         
         update_payload = {"raw_notes": [raw_notes]} if raw_notes else {}
         return tool_messages, update_payload
         
     except Exception as e:
-        logger.error(f"Error executing concurrent research: {e}")
-        return _handle_research_error(e, allowed_calls, config)
+        logger.error("Error executing concurrent research: %s", e)
+        return _handle_research_error(e, allowed_calls, configurable)
 
 
-def _handle_research_error(error: Exception, failed_calls: list, config: RunnableConfig) -> tuple[list[ToolMessage], dict]:
+def _handle_research_error(error: Exception, failed_calls: list, configurable: Configuration) -> tuple[list[ToolMessage], dict]:
     """Handle research execution errors with appropriate recovery strategy.
     
     Args:
         error: The exception that occurred
         failed_calls: List of tool calls that failed
-        config: Runtime configuration
+        configurable: Parsed runtime configuration
         
     Returns:
         Tuple of (error_tool_messages, update_payload)
     """
-    configurable = Configuration.from_runnable_config(config)
-    
     if is_token_limit_exceeded(error, configurable.default_model):
         logger.warning("Token limit exceeded during research execution")
         # Return empty to trigger research phase end
         raise error
     
     # For other errors, create error messages and continue
-    logger.warning(f"Research execution partially failed: {error}")
+    logger.warning("Research execution partially failed: %s", error)
     error_messages = [
         ToolMessage(
             content=f"Error executing research: {str(error)}",
@@ -263,38 +310,47 @@ async def supervisor_tools(state: SupervisorState, config: RunnableConfig) -> Co
     Returns:
         Command to either continue supervision loop or end research phase
     """
-    logger.info("🔧 Executing supervisor tools")
+    logger.debug("🔧 Executing supervisor tools")
+    
+    supervisor_messages = state.get("supervisor_messages", [])
+    most_recent_message = supervisor_messages[-1] if supervisor_messages else None
+    tool_calls = getattr(most_recent_message, "tool_calls", None) or []
+    
+    # Parse configuration once and share it with the helpers
+    configurable = Configuration.from_runnable_config(config)
     
-    # Check if research should end
-    should_end, end_update = _should_end_research(state, config)
-    if should_end:
+    # Check the cheap exit conditions before scanning tool calls
+    if _should_end_research(state, configurable, tool_calls):
         logger.info("🏁 Ending research phase")
-        return Command(goto=END, update=end_update)
+        return Command(goto=END, update=_end_research_update(state))
     
-    # Get tool calls from most recent message
-    supervisor_messages = state.get("supervisor_messages", [])
-    most_recent_message = supervisor_messages[-1]
-    tool_calls = most_recent_message.tool_calls
+    # Classify tool calls from most recent message in a single pass
+    think_tool_calls, research_calls, research_complete = _classify_tool_calls(tool_calls)
+    if research_complete:
+        logger.info("🏁 Research marked complete, ending research phase")
+        return Command(goto=END, update=_end_research_update(state))
     
     try:
-        logger.info(f"🔍 Processing supervisor tools with {len(tool_calls)} tool calls")
-        # Process different tool types
-        think_messages = _process_think_tools(tool_calls)
-        research_messages, research_update = await _process_research_tasks(tool_calls, config)
+        logger.debug("🔍 Processing supervisor tools with %d tool calls", len(tool_calls))
+        # Process reflections and research delegation concurrently
+        think_messages, (research_messages, research_update) = await asyncio.gather(
+            _process_think_tools(think_tool_calls),
+            _process_research_tasks(research_calls, configurable, config)
+        )
         
         # Combine all tool messages and updates
         all_tool_messages = think_messages + research_messages
         update_payload = {"supervisor_messages": all_tool_messages}
         update_payload.update(research_update)
         
-        logger.info(f"✅ Processed supervisor tools, added {len(all_tool_messages)} tool messages, continuing supervision")
+        logger.info("✅ Processed supervisor tools, added %d tool messages, continuing supervision", len(all_tool_messages))
         return Command(goto="supervisor", update=update_payload)
         
     except Exception as e:
         # Handle critical errors (like token limit exceeded)
-        if is_token_limit_exceeded(e, Configuration.from_runnable_config(config).default_model):
+        if is_token_limit_exceeded(e, configurable.default_model):
             logger.warning("Token limit exceeded, ending research phase")
-            return Command(goto=END, update=end_update)
+            return Command(goto=END, update=_end_research_update(state))
         
         # Re-raise other critical errors
         raise
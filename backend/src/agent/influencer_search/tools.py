@@ -0,0 +1,147 @@
+"""
+Research tools for influencer search workflow.
+
+Contains the LangChain tools bound to the supervisor and researcher models.
+Kept apart from the prompt templates so prompt-only imports skip the tool
+machinery.
+"""
+
+from langchain_core.tools import tool
+
+from agent.utils.runtime import get_http_session
+
+
+@tool(description="Strategic reflection tool for influencer marketing research planning")
+def think_tool(reflection: str) -> str:
+    """Tool for strategic reflection on influencer marketing research progress and decision-making.
+
+    Use this tool during research supervision to analyze progress and plan next steps systematically.
+    This creates a deliberate pause in the research workflow for quality decision-making in influencer campaigns.
+
+    When to use:
+    - After receiving research results: What key influencer insights did I discover?
+    - Before deciding next steps: Do I have enough data to make campaign recommendations?
+    - When assessing research gaps: What specific influencer marketing information am I still missing?
+    - Before concluding research: Can I provide actionable influencer recommendations now?
+
+    Reflection should address:
+    1. Analysis of current findings - What concrete influencer marketing insights have I gathered?
+    2. Gap assessment - What crucial campaign planning information is still missing?
+    3. Quality evaluation - Do I have sufficient influencer data/examples for strategic recommendations?
+    4. Strategic decision - Should I continue researching or provide campaign recommendations?
+
+    Args:
+        reflection: Your detailed reflection on research progress, findings, gaps, and next steps
+
+    Returns:
+        Confirmation that reflection was recorded for decision-making
+    """
+    return f"Strategic reflection recorded: {reflection}"
+
+
+_INFLUENCER_ROW_TEMPLATE = (
+    "{index}. {name}\n"
+    "   Platform: {platform}\n"
+    "   Followers: {followers:,}\n"
+    "   Location: {country}\n"
+    "   Engagement: {engagement:.2f}%\n"
+    "   Average Views: {average_views:,}\n"
+    "   Nox Score: {score:.2f}\n"
+)
+
+
+def _format_influencer_row(index: int, inf: dict, platform: str) -> str:
+    """Render one search API result as a numbered influencer entry."""
+    # Special handling for engagement to avoid None * 100 error
+    interactive_rate = inf.get('interactiveRate')
+    return _INFLUENCER_ROW_TEMPLATE.format(
+        index=index,
+        name=inf.get('nickName') or 'Unknown',
+        platform=platform,
+        followers=inf.get('followers') or 0,
+        country=inf.get('country') or 'Unknown',
+        engagement=(0 if interactive_rate is None else interactive_rate) * 100,
+        average_views=inf.get('estimateVideoViews') or 0,
+        score=inf.get('noxScore') or 0,
+    )
+
+
+@tool(description="Multi-platform influencer search engine supporting YouTube, Instagram, and TikTok.")
+async def influencer_search_tool(
+    keywords: list[str],
+    platform: str = "youtube",
+    min_followers: int = 50000,
+    max_followers: int = 1000000,
+    countries: str = "US,UK",
+    language: str = "en",
+    limit: int = 200
+) -> str:
+    """Search for influencers across social media platforms using keyword-based filtering.
+
+    Args:
+        keywords: List of search keywords to find relevant influencers
+        platform: Target platform for search (youtube, instagram, or tiktok)
+        min_followers: Minimum follower count threshold for filtering results
+        max_followers: Maximum follower count threshold for filtering results
+        countries: Comma-separated country codes for geographic filtering (e.g., "US,UK,CA")
+        language: Language code for content language filtering (e.g., "en", "es")
+        limit: Maximum number of results to return (capped at 200 for API limits)
+
+    Returns:
+        Formatted string containing influencer profiles with metrics including name, 
+        follower count, location, engagement rate, average views, and Nox score.
+    """
+    import os
+    
+    # Validate platform
+    if platform.lower() not in ['youtube', 'instagram', 'tiktok']:
+        return f"Unsupported platform: {platform}"
+    # API configuration
+    base_url = os.getenv('INFLUENCER_API_BASE_URL', 'http://10.101.150.253:10155')
+    uid = os.getenv('INFLUENCER_API_UID', '5773389b0e4207dfeebd6d34de70afea')
+    
+    # Format keywords with delimiter
+    formatted_keywords = ',5,'.join(keywords) + ',5'
+    
+    # Build request
+    url = f"{base_url}/ws/{platform.lower()}/star/search"
+    params = {
+        'followerGte': min_followers,
+        'followerLte': max_followers,
+        'country': countries,
+        'language': language,
+        'pageNum': 1,
+        'pageSize': min(limit, 200),  # Cap at 200 for API limits
+        'searchWords': formatted_keywords
+    }
+    headers = {'uid': uid}
+    
+    # Make request
+    try:
+        session = await get_http_session()
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status != 200:
+                return f"API error: {response.status}"
+            
+            data = await response.json()
+            
+            # Parse response
+            if data.get('errorNum') != 0 or 'retDataList' not in data:
+                return "No results found"
+            
+            influencers = data['retDataList']
+            if not influencers:
+                return f"No {platform} influencers found for '{', '.join(keywords)}'"
+            
+            # Format results
+            header = f"Found {len(influencers)} {platform} influencers for '{', '.join(keywords)}':\n"
+            results = "\n".join(
+                _format_influencer_row(i, inf, platform)
+                for i, inf in enumerate(influencers, 1)
+            )
+            
+            search_summary = f"Found {len(influencers)} {platform} influencers for '{', '.join(keywords)}', with {min_followers} to {max_followers} followers, in {countries} countries, in {language} language:\n"
+            return f"{search_summary}{header}\n{results}"
+            
+    except Exception as e:
+        return f"Search failed: {str(e)}"
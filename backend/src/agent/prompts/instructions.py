@@ -1,3 +1,5 @@
+from agent.prompts.templating import compile_prompt_template
+
 campaign_info_extraction_instructions = """
 你的目标是识别用户Messages中的网红营销的要求信息，将相关信息提取出来按照指定的格式输出，来确定用户对本次网红营销Campaign的基本要求。
 Instructions:
@@ -62,4 +64,10 @@ caliry_questions_template = """
 
 请您继续补充以下信息：
 {questions}
-"""
\ No newline at end of file
+"""
+
+
+# Pre-parsed renderers, so nodes skip re-lexing the templates with str.format on every call
+render_campaign_info_extraction = compile_prompt_template(campaign_info_extraction_instructions)
+render_clarify_campaign_info = compile_prompt_template(clarify_campaign_info_with_human_instructions)
+render_clarify_questions = compile_prompt_template(caliry_questions_template)
@@ -0,0 +1,36 @@
+"""
+Prompt template rendering shared by the influencer search and campaign graphs.
+"""
+
+from string import Formatter
+from typing import Callable
+
+
+def compile_prompt_template(template: str) -> Callable[..., str]:
+    """Pre-parse a str.format template into a fast renderer.
+    
+    str.format re-lexes the whole template on every call, which dominates for
+    long prompts. The template is split into literal and field segments once,
+    and rendering only joins the segments with the supplied values.
+    
+    Args:
+        template: Prompt template using plain {field} placeholders
+        
+    Returns:
+        Function rendering the template from keyword arguments, like template.format(**values)
+    """
+    segments = []
+    for literal, field, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported placeholder in prompt template: {{{field}}}")
+        segments.append((literal, field))
+    
+    def render(**values) -> str:
+        parts = []
+        for literal, field in segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+    
+    return render
@@ -0,0 +1,166 @@
+"""
+Runtime resources shared across graph runs.
+
+Contains the pooled chat model clients and the model settings shared by the
+influencer search and campaign graphs, the process-wide cap on in-flight
+LLM requests and the shared HTTP session used by the search tools. Kept
+apart from the prompt templates, which hold no runtime state.
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Chat Model Pool
+# ===============
+
+# Chat model clients keyed by (model_name, temperature, max_tokens), least recently used first
+_MODEL_POOL: "OrderedDict[tuple, Any]" = OrderedDict()
+_MODEL_POOL_MAX_SIZE = 16
+
+
+def get_or_create_model(model_name: str, temperature: float = 0.0, max_tokens: Optional[int] = None):
+    """Get a pooled chat model client, creating it on first use.
+
+    Model construction sets up provider clients and HTTP transports, so clients
+    are reused across nodes and turns. Callers bind tools, structured output and
+    retries on top, which wraps the pooled client without copying it.
+
+    Args:
+        model_name: Model identifier in provider:model format
+        temperature: Sampling temperature
+        max_tokens: Optional maximum output tokens
+
+    Returns:
+        Chat model instance shared by all callers with the same settings
+    """
+    key = (model_name, temperature, max_tokens)
+    model = _MODEL_POOL.get(key)
+    if model is not None:
+        _MODEL_POOL.move_to_end(key)
+        return model
+
+    model_kwargs = {
+        "model": model_name,
+        "temperature": temperature,
+    }
+    if max_tokens is not None:
+        model_kwargs["max_tokens"] = max_tokens
+
+    # Pass API key explicitly for Google GenAI to avoid default credentials lookup
+    if "google_genai" in model_name:
+        api_key = os.getenv("GEMINI_API_KEY")
+        if api_key:
+            model_kwargs["api_key"] = api_key
+
+    # Deferred so importing this module does not load the provider integrations
+    from langchain.chat_models import init_chat_model
+    model = init_chat_model(**model_kwargs)
+    _MODEL_POOL[key] = model
+    if len(_MODEL_POOL) > _MODEL_POOL_MAX_SIZE:
+        _MODEL_POOL.popitem(last=False)
+    return model
+
+
+def structured_output_kwargs(model_name: str) -> dict:
+    """Get with_structured_output arguments for a model.
+
+    Gemini models (provider:model or bare names) use native JSON mode, which
+    constrains decoding to the schema instead of adding a tool definition.
+    Other providers keep their integration's default method.
+    """
+    return {"method": "json_mode"} if "gemini" in model_name.lower() else {}
+
+
+# LLM Concurrency Limit
+# =====================
+
+# Process-wide cap on in-flight LLM requests: one semaphore per event loop, all sized
+# from the limit of the first request so every caller shares a single ceiling
+_LLM_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+_LLM_CONCURRENCY_LIMIT: Optional[int] = None
+
+
+def get_llm_semaphore(limit: int) -> asyncio.Semaphore:
+    """Get the semaphore that caps concurrent LLM requests across all graph runs.
+
+    Supervisors, researchers and report writers of every run share it, so bursts
+    queue locally instead of tripping provider rate limits and retry storms.
+    The cap is fixed by the first request in the process, which reads it from
+    MAX_LLM_CONCURRENCY when set; later limits are ignored so per-run overrides
+    cannot add up past it.
+
+    Args:
+        limit: Maximum number of LLM requests in flight, used only by the first call
+
+    Returns:
+        Semaphore shared by all callers on the running event loop
+    """
+    global _LLM_CONCURRENCY_LIMIT
+
+    if _LLM_CONCURRENCY_LIMIT is None:
+        _LLM_CONCURRENCY_LIMIT = limit
+
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(_LLM_CONCURRENCY_LIMIT)
+    return semaphore
+
+
+# HTTP Session
+# ============
+
+# Process-wide HTTP session shared by search tools so calls reuse keep-alive connections
+_HTTP_SESSION = None
+_HTTP_SESSION_LOOP = None
+
+
+async def get_http_session():
+    """Get the shared aiohttp session, creating it on first use.
+
+    A session is bound to the event loop it was created on, so a new one is
+    created when the running loop changes or the previous session was closed.
+    A session left over from another loop is closed first so its connector's
+    sockets are released.
+
+    Returns:
+        Shared aiohttp.ClientSession with a pooled keep-alive connector
+    """
+    import aiohttp
+    global _HTTP_SESSION, _HTTP_SESSION_LOOP
+
+    loop = asyncio.get_running_loop()
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed or _HTTP_SESSION_LOOP is not loop:
+        if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+            try:
+                await _HTTP_SESSION.close()
+            except Exception as e:
+                # Transports owned by a loop that has since shut down cannot be closed cleanly
+                logger.debug("Failed to close HTTP session from previous event loop: %s", e)
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        _HTTP_SESSION_LOOP = loop
+    return _HTTP_SESSION
+
+
+async def close_http_session():
+    """Close the shared aiohttp session if one is open."""
+    global _HTTP_SESSION, _HTTP_SESSION_LOOP
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+    _HTTP_SESSION = None
+    _HTTP_SESSION_LOOP = None
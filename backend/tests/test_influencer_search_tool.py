@@ -15,11 +15,18 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from agent.influencer_search.prompts import influencer_search_tool
+from agent.utils.runtime import close_http_session
 
 
 class TestInfluencerSearchTool:
     """Test suite for influencer_search_tool functionality."""
 
+    @pytest.fixture(autouse=True)
+    async def shared_http_session(self):
+        """Close the shared HTTP session after each test's event loop finishes."""
+        yield
+        await close_http_session()
+
     @pytest.fixture
     def mock_env_vars(self):
         """Mock environment variables for testing."""
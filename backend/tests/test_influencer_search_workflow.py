@@ -0,0 +1,359 @@
+"""
+Tests for influencer search workflow internals.
+
+Tests cover the influencer search graph nodes and the helpers they share,
+with LLM calls mocked.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+import os
+import weakref
+
+# Add the source directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from agent.influencer_search import nodes
+from agent.influencer_search.researcher import compress_research, get_researcher_subgraph, researcher_tools
+from agent.influencer_search.schemas import ClarifyWithUser, InfluencerResearchBrief
+from agent.utils import runtime
+
+
+def _tool_call(name, call_id, **args):
+    """Build a tool call entry as it appears on an AIMessage."""
+    return {"name": name, "args": args, "id": call_id, "type": "tool_call"}
+
+
+class TestResearcherSubgraph:
+    """Test suite for building and running the researcher subgraph."""
+
+    @pytest.fixture
+    def mock_gemini(self):
+        """Mock Gemini generation so every researcher turn signals completion."""
+        calls = []
+
+        async def agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+            calls.append(messages)
+            message = AIMessage(
+                content="Found fitness influencers",
+                tool_calls=[_tool_call("InfluencerResearchComplete", f"call-{len(calls)}")]
+            )
+            return ChatResult(generations=[ChatGeneration(message=message)])
+
+        with patch.dict(os.environ, {'GEMINI_API_KEY': 'test-key'}), \
+                patch.object(ChatGoogleGenerativeAI, '_agenerate', agenerate):
+            yield calls
+
+    @pytest.mark.asyncio
+    async def test_subgraph_runs_delegated_task(self, mock_gemini):
+        """Test that the researcher subgraph compiles and returns findings for a task."""
+        research_task_brief = "Find fitness influencers on Instagram"
+        result = await get_researcher_subgraph().ainvoke(
+            {
+                "researcher_messages": [HumanMessage(content=research_task_brief)],
+                "research_task_brief": research_task_brief,
+            },
+            {"configurable": {"default_model": "google_genai:gemini-2.5-flash"}}
+        )
+
+        assert mock_gemini
+        assert "Research completed" in result["compressed_research"]
+        assert "Found fitness influencers" in result["raw_notes"][0]
+
+
+class TestResearcherTools:
+    """Test suite for researcher tool dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_reflection_only_turn_skips_toolkit_lookup(self):
+        """Test that think_tool-only turns run locally without resolving the toolkit."""
+        state = {
+            "researcher_messages": [AIMessage(content="", tool_calls=[
+                _tool_call("think_tool", "call-think", reflection="plan the search")
+            ])],
+            "tool_call_iterations": 1,
+        }
+        get_cached_tools = AsyncMock()
+
+        with patch('agent.influencer_search.researcher.get_cached_tools', get_cached_tools):
+            command = await researcher_tools(state, {"configurable": {}})
+
+        get_cached_tools.assert_not_awaited()
+        assert command.goto == "researcher"
+        messages = command.update["researcher_messages"]
+        assert [message.tool_call_id for message in messages] == ["call-think"]
+        assert "plan the search" in messages[0].content
+
+    @pytest.mark.asyncio
+    async def test_tool_messages_follow_tool_calls_order(self):
+        """Test that results are emitted in call order even when later calls finish first."""
+        tool_calls = [
+            _tool_call("influencer_search_tool", "call-slow", query="slow"),
+            _tool_call("influencer_search_tool", "call-fast", query="fast"),
+            _tool_call("think_tool", "call-think", reflection="plan"),
+        ]
+        state = {
+            "researcher_messages": [AIMessage(content="", tool_calls=tool_calls)],
+            "tool_call_iterations": 1,
+        }
+
+        async def invoke_search(args, config):
+            # The first call finishes last
+            await asyncio.sleep(0.05 if args["query"] == "slow" else 0)
+            return f"result for {args['query']}"
+
+        invokers = {
+            "influencer_search_tool": invoke_search,
+            "think_tool": AsyncMock(return_value="reflection recorded"),
+        }
+
+        with patch('agent.influencer_search.researcher.get_cached_tools',
+                   AsyncMock(return_value=([], invokers))):
+            command = await researcher_tools(state, {"configurable": {}})
+
+        messages = command.update["researcher_messages"]
+        assert [message.tool_call_id for message in messages] == ["call-slow", "call-fast", "call-think"]
+        assert messages[0].content == "result for slow"
+        assert messages[1].content == "result for fast"
+
+    @pytest.mark.asyncio
+    async def test_completion_stubs_keep_tool_calls_order(self):
+        """Test that skipped calls and local reflections stay in call order on completion."""
+        tool_calls = [
+            _tool_call("influencer_search_tool", "call-search", query="skipped"),
+            _tool_call("think_tool", "call-think", reflection="wrap up"),
+            _tool_call("InfluencerResearchComplete", "call-complete"),
+        ]
+        state = {
+            "researcher_messages": [AIMessage(content="", tool_calls=tool_calls)],
+            "tool_call_iterations": 1,
+        }
+
+        command = await researcher_tools(state, {"configurable": {}})
+
+        assert command.goto == "compress_research"
+        messages = command.update["researcher_messages"]
+        assert [message.tool_call_id for message in messages] == ["call-search", "call-think", "call-complete"]
+        assert messages[0].content == "skipped: research complete"
+        assert all(isinstance(message, ToolMessage) for message in messages)
+
+
+class FakeCompressionModel:
+    """Chat model stand-in whose astream behaviour is scripted per attempt."""
+
+    def __init__(self, attempts):
+        self.attempts = list(attempts)
+        self.calls = []
+
+    async def astream(self, messages):
+        self.calls.append(messages)
+        attempt = self.attempts.pop(0)
+        if attempt == "hang":
+            await asyncio.Event().wait()
+        if isinstance(attempt, Exception):
+            raise attempt
+        for text in attempt:
+            yield AIMessageChunk(content=text)
+
+
+class TestResearchCompression:
+    """Test suite for LLM compression of researcher findings."""
+
+    @pytest.fixture
+    def compression_config(self):
+        """Runtime config with LLM compression enabled and a short timeout."""
+        return {"configurable": {
+            "enable_research_compression": True,
+            "compression_timeout": 0.05,
+            "default_model": "openai:gpt-4o",
+        }}
+
+    @pytest.fixture
+    def researcher_state(self):
+        """Researcher state with one search call and its result."""
+        return {"researcher_messages": [
+            AIMessage(content="", tool_calls=[
+                _tool_call("influencer_search_tool", "call-search", query="fitness")
+            ]),
+            ToolMessage(content="@fit_anna 120k followers", tool_call_id="call-search"),
+        ]}
+
+    @pytest.fixture
+    def backoff_sleep(self):
+        """Skip the real backoff delays between compression attempts."""
+        with patch('agent.influencer_search.researcher.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            yield mock_sleep
+
+    @pytest.mark.asyncio
+    async def test_retries_after_timeout_and_error(self, compression_config, researcher_state, backoff_sleep):
+        """Test that a timed out and a failed attempt are retried until compression streams a result."""
+        model = FakeCompressionModel(["hang", RuntimeError("503 Service Unavailable"), ["Compressed ", "findings"]])
+
+        with patch('agent.influencer_search.researcher.get_or_create_model', return_value=model):
+            result = await compress_research(researcher_state, compression_config)
+
+        assert result["compressed_research"] == "Compressed findings"
+        assert "@fit_anna 120k followers" in result["raw_notes"][0]
+        assert len(model.calls) == 3
+        assert backoff_sleep.await_count == 2
+        # Every attempt sends the system prompt followed by the local copy of the findings
+        assert all(len(messages) == 4 for messages in model.calls)
+        assert len(researcher_state["researcher_messages"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_maximum_attempts(self, compression_config, researcher_state, backoff_sleep):
+        """Test that compression reports an error once every attempt has timed out."""
+        model = FakeCompressionModel(["hang", "hang", "hang"])
+
+        with patch('agent.influencer_search.researcher.get_or_create_model', return_value=model):
+            result = await compress_research(researcher_state, compression_config)
+
+        assert result["compressed_research"] == "Error synthesizing research report: Maximum retries exceeded"
+        assert "@fit_anna 120k followers" in result["raw_notes"][0]
+        assert len(model.calls) == 3
+
+
+class TestModelPool:
+    """Test suite for the pooled chat model cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_model_pool(self):
+        """Start and finish each test with an empty model pool."""
+        runtime._MODEL_POOL.clear()
+        yield
+        runtime._MODEL_POOL.clear()
+
+    @pytest.fixture
+    def mock_init_chat_model(self):
+        """Mock chat model construction so each call returns a new object."""
+        with patch('langchain.chat_models.init_chat_model',
+                   MagicMock(side_effect=lambda **kwargs: object())) as mock_init:
+            yield mock_init
+
+    def test_reuses_model_for_same_settings(self, mock_init_chat_model):
+        """Test that identical settings share one model instance."""
+        first = runtime.get_or_create_model("openai:gpt-4o", 0.0)
+        second = runtime.get_or_create_model("openai:gpt-4o", 0.0)
+
+        assert first is second
+        assert mock_init_chat_model.call_count == 1
+
+    def test_evicts_least_recently_used_model(self, mock_init_chat_model):
+        """Test that the pool drops the least recently used model when full."""
+        with patch.object(runtime, '_MODEL_POOL_MAX_SIZE', 2):
+            model_a = runtime.get_or_create_model("openai:gpt-4o", 0.0)
+            model_b = runtime.get_or_create_model("openai:gpt-4o-mini", 0.0)
+
+            # Touch model_a so model_b becomes the least recently used entry
+            assert runtime.get_or_create_model("openai:gpt-4o", 0.0) is model_a
+            runtime.get_or_create_model("openai:gpt-5", 0.0)
+
+            assert len(runtime._MODEL_POOL) == 2
+            assert ("openai:gpt-4o-mini", 0.0, None) not in runtime._MODEL_POOL
+            assert runtime.get_or_create_model("openai:gpt-4o", 0.0) is model_a
+            assert runtime.get_or_create_model("openai:gpt-4o-mini", 0.0) is not model_b
+
+
+class TestLLMSemaphore:
+    """Test suite for the process-wide LLM concurrency limit."""
+
+    @pytest.fixture(autouse=True)
+    def unset_llm_limit(self):
+        """Start each test before any request has fixed the limit."""
+        with patch.object(runtime, '_LLM_CONCURRENCY_LIMIT', None), \
+                patch.object(runtime, '_LLM_SEMAPHORES', weakref.WeakKeyDictionary()):
+            yield
+
+    def test_first_limit_sizes_shared_semaphore(self):
+        """Test that callers with different limits share one semaphore sized by the first."""
+        async def acquire_limits():
+            return runtime.get_llm_semaphore(2), runtime.get_llm_semaphore(10)
+
+        first, second = asyncio.run(acquire_limits())
+
+        assert first is second
+        assert first._value == 2
+
+    def test_each_event_loop_gets_its_own_semaphore(self):
+        """Test that a new event loop gets a new semaphore with the same limit."""
+        async def acquire(limit):
+            return runtime.get_llm_semaphore(limit)
+
+        first = asyncio.run(acquire(3))
+        second = asyncio.run(acquire(5))
+
+        assert first is not second
+        assert second._value == 3
+
+
+class TestClarifyWithUser:
+    """Test suite for clarification and the research brief that follows it."""
+
+    @pytest.fixture
+    def clarify_config(self):
+        """Runtime config with clarification enabled."""
+        return {"configurable": {"allow_clarification": True}}
+
+    @pytest.fixture
+    def clarification_model(self):
+        """Mock structured clarification model; each test sets its response."""
+        model = MagicMock()
+        with patch.object(nodes, 'get_retrying_structured_model', return_value=model):
+            yield model
+
+    @pytest.fixture
+    def generate_research_brief(self):
+        """Mock research brief generation."""
+        brief = InfluencerResearchBrief(
+            research_brief="Find fitness influencers on Instagram",
+            target_platforms=["Instagram"],
+            niche_focus="fitness",
+            campaign_objectives=["brand awareness"]
+        )
+        with patch.object(nodes, '_generate_research_brief', AsyncMock(return_value=brief)) as mock_generate:
+            yield mock_generate
+
+    @pytest.mark.asyncio
+    async def test_clarifying_question_skips_brief_generation(self, clarify_config, clarification_model, generate_research_brief):
+        """Test that a turn ending with a clarifying question never generates a brief."""
+        clarification_model.ainvoke = AsyncMock(return_value=ClarifyWithUser(
+            need_clarification=True,
+            question="Which platform should we focus on?",
+            verification=""
+        ))
+        state = {"messages": [HumanMessage(content="find influencers")]}
+
+        command = await nodes.clarify_with_user(state, clarify_config)
+
+        assert command.goto == nodes.END
+        assert command.update["messages"][0].content == "Which platform should we focus on?"
+        clarification_model.ainvoke.assert_awaited_once()
+        generate_research_brief.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_brief_generated_from_conversation_with_verification(self, clarify_config, clarification_model, generate_research_brief):
+        """Test that the brief is generated after clarification, from the verified conversation."""
+        clarification_model.ainvoke = AsyncMock(return_value=ClarifyWithUser(
+            need_clarification=False,
+            question="",
+            verification="Searching for fitness influencers on Instagram."
+        ))
+        state = {"messages": [HumanMessage(content="find fitness influencers on instagram")]}
+
+        command = await nodes.clarify_with_user(state, clarify_config)
+
+        assert command.goto == "write_research_brief"
+        generate_research_brief.assert_not_awaited()
+
+        state = {**state, **command.update, "messages": state["messages"] + command.update["messages"]}
+        command = await nodes.write_research_brief(state, clarify_config)
+
+        assert command.goto == "research_supervisor"
+        messages_buffer = generate_research_brief.await_args.args[0]
+        assert "Searching for fitness influencers on Instagram." in messages_buffer